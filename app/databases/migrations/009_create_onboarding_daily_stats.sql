@@ -0,0 +1,97 @@
+-- Migration: 009_create_onboarding_daily_stats.sql
+-- Description: Trigger-maintained daily roll-up of onboarding_progress for the completion summary
+
+-- =============================================
+-- ONBOARDING DAILY STATS TABLE
+-- =============================================
+
+-- One row per start date, so the 30-day summary reads ~30 rows instead of scanning onboarding_progress
+CREATE TABLE IF NOT EXISTS onboarding_daily_stats (
+    started_on DATE PRIMARY KEY,
+    total_users BIGINT NOT NULL DEFAULT 0,
+    completed_users BIGINT NOT NULL DEFAULT 0,
+    timed_users BIGINT NOT NULL DEFAULT 0,
+    completion_seconds DOUBLE PRECISION NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+);
+
+-- Add comments for onboarding_daily_stats table
+COMMENT ON TABLE onboarding_daily_stats IS 'Per-day onboarding counters maintained by trigger on onboarding_progress';
+COMMENT ON COLUMN onboarding_daily_stats.started_on IS 'Date the counted onboardings were started';
+COMMENT ON COLUMN onboarding_daily_stats.completed_users IS 'Onboardings started that day that are currently completed';
+COMMENT ON COLUMN onboarding_daily_stats.timed_users IS 'Onboardings started that day that have a completed_at timestamp';
+COMMENT ON COLUMN onboarding_daily_stats.completion_seconds IS 'Sum of completed_at - started_at over timed_users';
+
+-- =============================================
+-- MAINTENANCE TRIGGER
+-- =============================================
+
+-- Add (sign = 1) or remove (sign = -1) one onboarding_progress row's contribution
+CREATE OR REPLACE FUNCTION apply_onboarding_daily_stats(
+    row_started_at TIMESTAMP WITH TIME ZONE,
+    row_is_completed BOOLEAN,
+    row_completed_at TIMESTAMP WITH TIME ZONE,
+    sign INTEGER
+)
+RETURNS VOID AS $$
+BEGIN
+    IF row_started_at IS NULL THEN
+        RETURN;
+    END IF;
+
+    INSERT INTO onboarding_daily_stats AS stats (
+        started_on, total_users, completed_users, timed_users, completion_seconds
+    ) VALUES (
+        row_started_at::date,
+        sign,
+        CASE WHEN row_is_completed THEN sign ELSE 0 END,
+        CASE WHEN row_completed_at IS NOT NULL THEN sign ELSE 0 END,
+        COALESCE(EXTRACT(EPOCH FROM (row_completed_at - row_started_at)), 0) * sign
+    )
+    ON CONFLICT (started_on) DO UPDATE SET
+        total_users = stats.total_users + EXCLUDED.total_users,
+        completed_users = stats.completed_users + EXCLUDED.completed_users,
+        timed_users = stats.timed_users + EXCLUDED.timed_users,
+        completion_seconds = stats.completion_seconds + EXCLUDED.completion_seconds,
+        updated_at = NOW();
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION maintain_onboarding_daily_stats()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM apply_onboarding_daily_stats(OLD.started_at, OLD.is_completed, OLD.completed_at, -1);
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        PERFORM apply_onboarding_daily_stats(NEW.started_at, NEW.is_completed, NEW.completed_at, 1);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- =============================================
+-- BACKFILL FROM EXISTING ROWS, THEN ATTACH TRIGGER
+-- =============================================
+
+-- Block writers until the trigger is attached so no row is missed or counted twice
+LOCK TABLE onboarding_progress IN SHARE ROW EXCLUSIVE MODE;
+
+INSERT INTO onboarding_daily_stats (started_on, total_users, completed_users, timed_users, completion_seconds)
+SELECT
+    started_at::date,
+    COUNT(*),
+    COUNT(CASE WHEN is_completed = true THEN 1 END),
+    COUNT(completed_at),
+    COALESCE(SUM(EXTRACT(EPOCH FROM (completed_at - started_at))), 0)
+FROM onboarding_progress
+WHERE started_at IS NOT NULL
+GROUP BY started_at::date
+ON CONFLICT (started_on) DO NOTHING;
+
+DROP TRIGGER IF EXISTS trigger_onboarding_daily_stats ON onboarding_progress;
+
+CREATE TRIGGER trigger_onboarding_daily_stats
+    AFTER INSERT OR DELETE OR UPDATE OF started_at, is_completed, completed_at ON onboarding_progress
+    FOR EACH ROW
+    EXECUTE FUNCTION maintain_onboarding_daily_stats();
@@ -0,0 +1,21 @@
+-- Migration: 010_unique_onboarding_progress_user.sql
+-- Description: Enforce one onboarding_progress row per user so progress can be upserted on user_id
+
+-- Keep only the most recently updated progress row for any user with duplicates
+DELETE FROM onboarding_progress
+WHERE id IN (
+    SELECT id FROM (
+        SELECT
+            id,
+            ROW_NUMBER() OVER (
+                PARTITION BY user_id
+                ORDER BY updated_at DESC NULLS LAST, created_at DESC NULLS LAST, id DESC
+            ) AS row_rank
+        FROM onboarding_progress
+    ) ranked
+    WHERE row_rank > 1
+);
+
+-- Unique index replaces the plain user_id index from migration 008 and backs ON CONFLICT (user_id)
+CREATE UNIQUE INDEX IF NOT EXISTS idx_onboarding_progress_user_id_unique ON onboarding_progress(user_id);
+DROP INDEX IF EXISTS idx_onboarding_progress_user_id;
@@ -22,9 +22,9 @@ logger = logging.getLogger(__name__)
 class AnalyticsRepository(BaseRepository):
     """Repository for analytics, AI recommendations, and gamification data"""
 
-    def __init__(self):
+    def __init__(self, pool: Optional[asyncpg.Pool] = None):
         # Note: This repository handles multiple tables, so we'll override methods as needed
-        super().__init__("ai_recommendations")  # Default table
+        super().__init__("ai_recommendations", pool=pool)  # Default table
 
     def _record_to_model(self, record: asyncpg.Record) -> Any:
         """This method will be overridden by specific methods"""
@@ -6,7 +6,8 @@ All specific repositories inherit from this base class.
 import asyncpg
 import logging
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Union, Type, TypeVar, Generic
+from contextlib import asynccontextmanager
+from typing import Any, AsyncGenerator, Dict, List, Optional, Union, Type, TypeVar, Generic
 from uuid import UUID
 from datetime import datetime
 
@@ -17,6 +18,9 @@ logger = logging.getLogger(__name__)
 # Generic type for models
 T = TypeVar('T')
 
+# PostgreSQL's limit on bind parameters in a single statement
+MAX_QUERY_PARAMETERS = 32767
+
 
 class DatabaseError(Exception):
     """Custom exception for database operations"""
@@ -41,9 +45,16 @@ class BaseRepository(ABC, Generic[T]):
     the abstract methods for their specific table operations.
     """
 
-    def __init__(self, table_name: str):
+    def __init__(self, table_name: str, pool: Optional[asyncpg.Pool] = None):
+        """
+        Args:
+            table_name: Table this repository operates on
+            pool: Optional asyncpg pool to acquire connections from instead of the
+                application-wide db_manager pool (e.g. a test session pool)
+        """
         self.table_name = table_name
         self.db_manager = db_manager
+        self.pool = pool
 
     @abstractmethod
     def _record_to_model(self, record: asyncpg.Record) -> T:
@@ -55,11 +66,33 @@ class BaseRepository(ABC, Generic[T]):
         """Convert a model instance to a dictionary for database operations"""
         pass
 
-    async def _execute_with_error_handling(self, query: str, *args) -> Any:
+    @asynccontextmanager
+    async def _acquire(
+        self, conn: Optional[asyncpg.Connection] = None
+    ) -> AsyncGenerator[asyncpg.Connection, None]:
+        """
+        Yield the caller's connection if one was given, otherwise acquire one from the
+        repository's own pool, falling back to the shared db_manager pool.
+
+        Lets callers pin several repository calls to one connection (e.g. inside a
+        transaction) or spread independent calls over separate pool connections.
+        """
+        if conn is not None:
+            yield conn
+        elif self.pool is not None:
+            async with self.pool.acquire() as pooled_conn:
+                yield pooled_conn
+        else:
+            async with self.db_manager.get_connection() as pooled_conn:
+                yield pooled_conn
+
+    async def _execute_with_error_handling(
+        self, query: str, *args, conn: Optional[asyncpg.Connection] = None
+    ) -> Any:
         """Execute a query with proper error handling"""
         try:
-            async with self.db_manager.get_connection() as conn:
-                return await conn.execute(query, *args)
+            async with self._acquire(conn) as connection:
+                return await connection.execute(query, *args)
         except asyncpg.UniqueViolationError as e:
             logger.error(f"Unique constraint violation: {e}")
             raise DuplicateRecordError(f"Record already exists: {e}")
@@ -73,11 +106,13 @@ class BaseRepository(ABC, Generic[T]):
             logger.error(f"Unexpected error in query execution: {e}")
             raise DatabaseError(f"Unexpected database error: {e}")
 
-    async def _fetch_one_with_error_handling(self, query: str, *args) -> Optional[asyncpg.Record]:
+    async def _fetch_one_with_error_handling(
+        self, query: str, *args, conn: Optional[asyncpg.Connection] = None
+    ) -> Optional[asyncpg.Record]:
         """Fetch one record with proper error handling"""
         try:
-            async with self.db_manager.get_connection() as conn:
-                return await conn.fetchrow(query, *args)
+            async with self._acquire(conn) as connection:
+                return await connection.fetchrow(query, *args)
         except asyncpg.PostgresError as e:
             logger.error(f"Database error: {e}")
             raise DatabaseError(f"Database query failed: {e}")
@@ -85,11 +120,13 @@ class BaseRepository(ABC, Generic[T]):
             logger.error(f"Unexpected error in query execution: {e}")
             raise DatabaseError(f"Unexpected database error: {e}")
 
-    async def _fetch_all_with_error_handling(self, query: str, *args) -> List[asyncpg.Record]:
+    async def _fetch_all_with_error_handling(
+        self, query: str, *args, conn: Optional[asyncpg.Connection] = None
+    ) -> List[asyncpg.Record]:
         """Fetch all records with proper error handling"""
         try:
-            async with self.db_manager.get_connection() as conn:
-                return await conn.fetch(query, *args)
+            async with self._acquire(conn) as connection:
+                return await connection.fetch(query, *args)
         except asyncpg.PostgresError as e:
             logger.error(f"Database error: {e}")
             raise DatabaseError(f"Database query failed: {e}")
@@ -97,12 +134,13 @@ class BaseRepository(ABC, Generic[T]):
             logger.error(f"Unexpected error in query execution: {e}")
             raise DatabaseError(f"Unexpected database error: {e}")
 
-    async def create(self, model: T) -> T:
+    async def create(self, model: T, conn: Optional[asyncpg.Connection] = None) -> T:
         """
         Create a new record in the database.
         
         Args:
             model: The model instance to create
+            conn: Optional connection to run on instead of acquiring one from the pool
             
         Returns:
             The created model with database-generated fields
@@ -128,8 +166,8 @@ class BaseRepository(ABC, Generic[T]):
         """
         
         try:
-            async with self.db_manager.get_connection() as conn:
-                record = await conn.fetchrow(query, *values)
+            async with self._acquire(conn) as connection:
+                record = await connection.fetchrow(query, *values)
                 if record:
                     return self._record_to_model(record)
                 else:
@@ -147,12 +185,93 @@ class BaseRepository(ABC, Generic[T]):
             logger.error(f"Unexpected error in create operation: {e}")
             raise DatabaseError(f"Unexpected database error: {e}")
 
-    async def get_by_id(self, record_id: Union[str, UUID]) -> Optional[T]:
+    async def bulk_create(self, models: List[T], conn: Optional[asyncpg.Connection] = None) -> List[T]:
+        """
+        Create several records with one multi-row INSERT ... RETURNING * per batch.
+
+        None values are sent as DEFAULT, like the columns create() leaves out. Rows are
+        split into several statements only to stay under PostgreSQL's bind parameter
+        limit; those statements then run in one transaction.
+
+        Args:
+            models: The model instances to create; each must carry its own id
+            conn: Optional connection to run on instead of acquiring one from the pool
+
+        Returns:
+            The created models, in the same order as models
+
+        Raises:
+            DuplicateRecordError: If a record already exists
+            DatabaseError: For other database errors
+        """
+        if not models:
+            return []
+
+        rows = [self._model_to_dict(model) for model in models]
+        columns = [column for column in rows[0] if any(row[column] is not None for row in rows)]
+        batch_size = max(1, MAX_QUERY_PARAMETERS // len(columns))
+
+        statements = []
+        for start in range(0, len(rows), batch_size):
+            values: List[Any] = []
+            row_placeholders = []
+            for row in rows[start:start + batch_size]:
+                placeholders = []
+                for column in columns:
+                    if row[column] is None:
+                        placeholders.append("DEFAULT")
+                    else:
+                        values.append(row[column])
+                        placeholders.append(f"${len(values)}")
+                row_placeholders.append(f"({', '.join(placeholders)})")
+
+            query = f"""
+                INSERT INTO {self.table_name} ({', '.join(columns)})
+                VALUES {', '.join(row_placeholders)}
+                RETURNING *
+            """
+            statements.append((query, values))
+
+        created: Dict[str, T] = {}
+        try:
+            async with self._acquire(conn) as connection:
+                if len(statements) == 1:
+                    records = await connection.fetch(statements[0][0], *statements[0][1])
+                else:
+                    async with connection.transaction():
+                        records = [
+                            record
+                            for query, values in statements
+                            for record in await connection.fetch(query, *values)
+                        ]
+                for record in records:
+                    created[str(record['id'])] = self._record_to_model(record)
+        except asyncpg.UniqueViolationError as e:
+            logger.error(f"Unique constraint violation: {e}")
+            raise DuplicateRecordError(f"Record already exists: {e}")
+        except asyncpg.ForeignKeyViolationError as e:
+            logger.error(f"Foreign key constraint violation: {e}")
+            raise DatabaseError(f"Foreign key constraint violated: {e}")
+        except asyncpg.PostgresError as e:
+            logger.error(f"Database error: {e}")
+            raise DatabaseError(f"Database operation failed: {e}")
+        except Exception as e:
+            logger.error(f"Unexpected error in bulk create operation: {e}")
+            raise DatabaseError(f"Unexpected database error: {e}")
+
+        if len(created) != len(rows):
+            raise DatabaseError("Failed to create records - not every row was returned")
+        return [created[str(row['id'])] for row in rows]
+
+    async def get_by_id(
+        self, record_id: Union[str, UUID], conn: Optional[asyncpg.Connection] = None
+    ) -> Optional[T]:
         """
         Get a record by its ID.
         
         Args:
             record_id: The ID of the record to retrieve
+            conn: Optional connection to run on instead of acquiring one from the pool
             
         Returns:
             The model instance if found, None otherwise
@@ -161,7 +280,7 @@ class BaseRepository(ABC, Generic[T]):
             DatabaseError: For database errors
         """
         query = f"SELECT * FROM {self.table_name} WHERE id = $1"
-        record = await self._fetch_one_with_error_handling(query, str(record_id))
+        record = await self._fetch_one_with_error_handling(query, str(record_id), conn=conn)
         
         if record:
             return self._record_to_model(record)
@@ -191,13 +310,19 @@ class BaseRepository(ABC, Generic[T]):
         records = await self._fetch_all_with_error_handling(query)
         return [self._record_to_model(record) for record in records]
 
-    async def update(self, record_id: Union[str, UUID], updates: Dict[str, Any]) -> Optional[T]:
+    async def update(
+        self,
+        record_id: Union[str, UUID],
+        updates: Dict[str, Any],
+        conn: Optional[asyncpg.Connection] = None
+    ) -> Optional[T]:
         """
         Update a record by its ID.
         
         Args:
             record_id: The ID of the record to update
             updates: Dictionary of field names and new values
+            conn: Optional connection to run on instead of acquiring one from the pool
             
         Returns:
             The updated model instance if found, None otherwise
@@ -206,7 +331,7 @@ class BaseRepository(ABC, Generic[T]):
             DatabaseError: For database errors
         """
         if not updates:
-            return await self.get_by_id(record_id)
+            return await self.get_by_id(record_id, conn=conn)
         
         # Remove None values and add updated_at
         update_data = {k: v for k, v in updates.items() if v is not None}
@@ -223,7 +348,7 @@ class BaseRepository(ABC, Generic[T]):
             RETURNING *
         """
         
-        record = await self._fetch_one_with_error_handling(query, *values)
+        record = await self._fetch_one_with_error_handling(query, *values, conn=conn)
         
         if record:
             return self._record_to_model(record)
@@ -323,13 +448,16 @@ class BaseRepository(ABC, Generic[T]):
         records = await self._fetch_all_with_error_handling(query, field_value)
         return [self._record_to_model(record) for record in records]
 
-    async def find_one_by_field(self, field_name: str, field_value: Any) -> Optional[T]:
+    async def find_one_by_field(
+        self, field_name: str, field_value: Any, conn: Optional[asyncpg.Connection] = None
+    ) -> Optional[T]:
         """
         Find a single record by a specific field value.
         
         Args:
             field_name: Name of the field to search
             field_value: Value to search for
+            conn: Optional connection to run on instead of acquiring one from the pool
             
         Returns:
             The model instance if found, None otherwise
@@ -338,7 +466,7 @@ class BaseRepository(ABC, Generic[T]):
             DatabaseError: For database errors
         """
         query = f"SELECT * FROM {self.table_name} WHERE {field_name} = $1 LIMIT 1"
-        record = await self._fetch_one_with_error_handling(query, field_value)
+        record = await self._fetch_one_with_error_handling(query, field_value, conn=conn)
         
         if record:
             return self._record_to_model(record)
@@ -358,7 +486,7 @@ class BaseRepository(ABC, Generic[T]):
             DatabaseError: For database errors
         """
         try:
-            async with self.db_manager.get_connection() as conn:
+            async with self._acquire() as conn:
                 async with conn.transaction():
                     results = []
                     for query, *args in operations:
@@ -397,7 +525,7 @@ class BaseRepository(ABC, Generic[T]):
         """
         try:
             count = await self.count()
-            async with self.db_manager.get_connection() as conn:
+            async with self._acquire() as conn:
                 await conn.fetchval("SELECT 1")
             return {
                 "table": self.table_name,
@@ -19,8 +19,8 @@ logger = logging.getLogger(__name__)
 class DebtRepository(BaseRepository[DebtInDB]):
     """Repository for debt operations"""
 
-    def __init__(self):
-        super().__init__("debts")
+    def __init__(self, pool: Optional[asyncpg.Pool] = None):
+        super().__init__("debts", pool=pool)
 
     def _record_to_model(self, record: asyncpg.Record) -> DebtInDB:
         """Convert database record to DebtInDB model"""
@@ -74,17 +74,9 @@ class DebtRepository(BaseRepository[DebtInDB]):
             'is_active': model.is_active
         }
 
-    async def create_debt(self, debt_create: DebtCreate) -> DebtInDB:
-        """
-        Create a new debt record.
-        
-        Args:
-            debt_create: Debt creation data
-            
-        Returns:
-            Created debt
-        """
-        debt_in_db = DebtInDB(
+    def _create_to_model(self, debt_create: DebtCreate) -> DebtInDB:
+        """Build the DebtInDB row to insert for a DebtCreate"""
+        return DebtInDB(
             user_id=debt_create.user_id,
             name=debt_create.name,
             debt_type=debt_create.debt_type,
@@ -105,8 +97,49 @@ class DebtRepository(BaseRepository[DebtInDB]):
             updated_at=datetime.now(),
             is_active=True
         )
+
+    async def create_debt(self, debt_create: DebtCreate) -> DebtInDB:
+        """
+        Create a new debt record.
         
-        return await self.create(debt_in_db)
+        Args:
+            debt_create: Debt creation data
+            
+        Returns:
+            Created debt
+        """
+        return await self.create(self._create_to_model(debt_create))
+
+    async def bulk_create_debts(self, debt_creates: List[DebtCreate]) -> List[DebtInDB]:
+        """
+        Create multiple debt records with a single multi-row INSERT.
+        
+        Args:
+            debt_creates: Debt creation data, one entry per debt
+            
+        Returns:
+            Created debts, in the same order as debt_creates
+        """
+        return await self.bulk_create([
+            self._create_to_model(debt_create) for debt_create in debt_creates
+        ])
+
+    async def bulk_delete_debts(self, user_id: UUID, debt_ids: List[UUID]) -> List[UUID]:
+        """
+        Delete several of a user's debts in a single statement.
+        
+        Args:
+            user_id: Owner of the debts; ids belonging to other users are left untouched
+            debt_ids: IDs of the debts to delete
+            
+        Returns:
+            IDs of the debts that were deleted
+        """
+        query = f"DELETE FROM {self.table_name} WHERE user_id = $1 AND id = ANY($2::uuid[]) RETURNING id"
+        records = await self._fetch_all_with_error_handling(
+            query, str(user_id), [str(debt_id) for debt_id in debt_ids]
+        )
+        return [record['id'] for record in records]
 
     async def get_user_debts(self, user_id: UUID, include_inactive: bool = False) -> List[DebtInDB]:
         """
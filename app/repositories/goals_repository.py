@@ -29,8 +29,8 @@ class GoalsRepository(BaseRepository[UserGoalResponse]):
     including creation, updates, progress tracking, and analytics.
     """
 
-    def __init__(self):
-        super().__init__("user_goals")
+    def __init__(self, pool: Optional[asyncpg.Pool] = None):
+        super().__init__("user_goals", pool=pool)
 
     def _record_to_model(self, record: asyncpg.Record) -> UserGoalResponse:
         """Convert database record to UserGoalResponse model"""
@@ -133,6 +133,20 @@ class GoalsRepository(BaseRepository[UserGoalResponse]):
         records = await self._fetch_all_with_error_handling(query, *params)
         return [self._record_to_model(record) for record in records]
 
+    async def count_active_goals(self, user_id: UUID) -> int:
+        """
+        Count a user's active goals without loading them.
+
+        Served by the partial index idx_user_goals_active (user_id, is_active) WHERE is_active.
+
+        Args:
+            user_id: The user's UUID
+
+        Returns:
+            Number of active goals for the user
+        """
+        return await self.count("user_id = $1 AND is_active = true", str(user_id))
+
     async def get_goal_by_id(self, goal_id: UUID) -> Optional[UserGoalResponse]:
         """
         Get a specific goal by its ID.
@@ -6,7 +6,8 @@ Handles onboarding progress tracking, step management, and analytics.
 import asyncpg
 import json
 import logging
-from typing import Optional, List, Dict, Any
+import time
+from typing import Optional, List, Dict, Any, Tuple, Union
 from datetime import datetime
 from uuid import UUID
 
@@ -24,6 +25,38 @@ from app.repositories.base_repository import BaseRepository, RecordNotFoundError
 
 logger = logging.getLogger(__name__)
 
+# Serialised step names, resolved once instead of through the enum on every call
+_STEP_VALUES: Dict[OnboardingStep, str] = {step: step.value for step in OnboardingStep}
+_WELCOME_VALUE = _STEP_VALUES[OnboardingStep.WELCOME]
+_COMPLETED_VALUE = _STEP_VALUES[OnboardingStep.COMPLETED]
+
+# Hot-path statements kept as constant SQL text so asyncpg's per-connection
+# prepared statement cache hits on every call instead of re-parsing/planning
+_SELECT_BY_USER_QUERY = "SELECT * FROM onboarding_progress WHERE user_id = $1 LIMIT 1"
+_UPDATE_STEP_QUERY = """
+    UPDATE onboarding_progress
+    SET current_step = $2,
+        onboarding_data = CASE
+            WHEN $4::jsonb IS NULL THEN COALESCE(onboarding_data, '{}'::jsonb)
+            ELSE jsonb_set(COALESCE(onboarding_data, '{}'::jsonb), $3::text[], $4::jsonb, true)
+        END,
+        updated_at = NOW()
+    WHERE user_id = $1
+    RETURNING *
+"""
+_RESET_QUERY = """
+    INSERT INTO onboarding_progress (user_id, current_step, completed_steps, onboarding_data, is_completed)
+    VALUES ($1, $2, '[]'::jsonb, '{}'::jsonb, false)
+    ON CONFLICT (user_id) DO UPDATE SET
+        current_step = EXCLUDED.current_step,
+        completed_steps = EXCLUDED.completed_steps,
+        onboarding_data = EXCLUDED.onboarding_data,
+        is_completed = false,
+        completed_at = NULL,
+        updated_at = NOW()
+    RETURNING *
+"""
+
 
 class OnboardingRepository(BaseRepository[OnboardingProgressResponse]):
     """
@@ -33,8 +66,51 @@ class OnboardingRepository(BaseRepository[OnboardingProgressResponse]):
     including progress tracking, step management, and analytics.
     """
 
-    def __init__(self):
-        super().__init__("onboarding_progress")
+    # Upper bound on cached users; the oldest entry is evicted first
+    CACHE_MAX_SIZE = 1024
+
+    def __init__(
+        self,
+        cache_ttl_seconds: Optional[float] = None,
+        pool: Optional[asyncpg.Pool] = None
+    ):
+        """
+        Args:
+            cache_ttl_seconds: Opt-in TTL for memoising get_user_onboarding per user.
+                None (default) disables the cache so every call hits the database.
+            pool: Optional asyncpg pool to use instead of the shared db_manager pool
+        """
+        super().__init__("onboarding_progress", pool=pool)
+        self.cache_ttl_seconds = cache_ttl_seconds
+        self._onboarding_cache: Dict[str, Tuple[float, OnboardingProgressResponse]] = {}
+
+    def _get_cached_onboarding(self, user_id: UUID) -> Optional[OnboardingProgressResponse]:
+        """Return the cached onboarding for a user if caching is enabled and the entry is fresh"""
+        if self.cache_ttl_seconds is None:
+            return None
+        entry = self._onboarding_cache.get(str(user_id))
+        if entry is None:
+            return None
+        cached_at, onboarding = entry
+        if time.monotonic() - cached_at > self.cache_ttl_seconds:
+            del self._onboarding_cache[str(user_id)]
+            return None
+        return onboarding
+
+    def _cache_onboarding(self, onboarding: OnboardingProgressResponse) -> None:
+        """Store an onboarding record in the per-user cache"""
+        if self.cache_ttl_seconds is None:
+            return
+        if len(self._onboarding_cache) >= self.CACHE_MAX_SIZE:
+            self._onboarding_cache.pop(next(iter(self._onboarding_cache)))
+        self._onboarding_cache[str(onboarding.user_id)] = (time.monotonic(), onboarding)
+
+    def invalidate_cache(self, user_id: Optional[UUID] = None) -> None:
+        """Drop the cached onboarding for one user, or for all users if none given"""
+        if user_id is None:
+            self._onboarding_cache.clear()
+        else:
+            self._onboarding_cache.pop(str(user_id), None)
 
     def _record_to_model(self, record: asyncpg.Record) -> OnboardingProgressResponse:
         """Convert database record to OnboardingProgressResponse model"""
@@ -63,7 +139,7 @@ class OnboardingRepository(BaseRepository[OnboardingProgressResponse]):
         """Convert onboarding model to dictionary for database operations"""
         base_dict = {
             'user_id': str(model.user_id),
-            'current_step': model.current_step.value if hasattr(model.current_step, 'value') else model.current_step,
+            'current_step': _STEP_VALUES.get(model.current_step, model.current_step),
             'completed_steps': json.dumps(model.completed_steps),
             'onboarding_data': json.dumps(model.onboarding_data),
             'is_completed': model.is_completed,
@@ -83,12 +159,17 @@ class OnboardingRepository(BaseRepository[OnboardingProgressResponse]):
             
         return base_dict
 
-    async def create_onboarding_progress(self, user_id: UUID) -> OnboardingProgressResponse:
+    async def create_onboarding_progress(
+        self,
+        user_id: UUID,
+        conn: Optional[asyncpg.Connection] = None
+    ) -> OnboardingProgressResponse:
         """
         Create initial onboarding progress for a user.
 
         Args:
             user_id: The user's UUID
+            conn: Optional connection to run on instead of acquiring one from the pool
 
         Returns:
             Created onboarding progress record
@@ -98,7 +179,7 @@ class OnboardingRepository(BaseRepository[OnboardingProgressResponse]):
             DatabaseError: For other database errors
         """
         # Check if onboarding progress already exists
-        existing = await self.get_user_onboarding(user_id)
+        existing = await self.get_user_onboarding(user_id, conn=conn)
         if existing:
             raise DuplicateRecordError(f"Onboarding progress already exists for user {user_id}")
 
@@ -110,33 +191,68 @@ class OnboardingRepository(BaseRepository[OnboardingProgressResponse]):
             is_completed=False
         )
 
-        return await self.create(onboarding_create)
+        return await self.create(onboarding_create, conn=conn)
 
-    async def get_user_onboarding(self, user_id: UUID) -> Optional[OnboardingProgressResponse]:
+    async def get_user_onboarding(
+        self,
+        user_id: UUID,
+        conn: Optional[asyncpg.Connection] = None
+    ) -> Optional[OnboardingProgressResponse]:
         """
         Get user's onboarding progress.
 
         Args:
             user_id: The user's UUID
+            conn: Optional connection to run on instead of acquiring one from the pool
 
         Returns:
             User's onboarding progress if found, None otherwise
+
+        When the repository was built with cache_ttl_seconds, hits are served from a
+        per-user cache until the TTL lapses or the record is updated through this repository.
         """
-        return await self.find_one_by_field('user_id', str(user_id))
+        cached = self._get_cached_onboarding(user_id)
+        if cached is not None:
+            return cached
+
+        record = await self._fetch_one_with_error_handling(_SELECT_BY_USER_QUERY, str(user_id), conn=conn)
+        if record:
+            onboarding = self._record_to_model(record)
+            self._cache_onboarding(onboarding)
+            return onboarding
+        return None
+
+    async def update(
+        self,
+        record_id: Union[str, UUID],
+        updates: Dict[str, Any],
+        conn: Optional[asyncpg.Connection] = None
+    ) -> Optional[OnboardingProgressResponse]:
+        """Update an onboarding record and drop its user's cached copy"""
+        updated = await super().update(record_id, updates, conn=conn)
+        if updated is not None:
+            self.invalidate_cache(updated.user_id)
+        return updated
 
     async def update_onboarding_step(
         self,
         user_id: UUID,
         step: OnboardingStep,
-        step_data: Optional[Dict[str, Any]] = None
+        step_data: Optional[Dict[str, Any]] = None,
+        conn: Optional[asyncpg.Connection] = None
     ) -> OnboardingProgressResponse:
         """
         Update onboarding step and store step data.
 
+        Runs as a single UPDATE that merges the step data server-side with jsonb_set,
+        so there is one round trip, the rest of onboarding_data is never re-serialised,
+        and concurrent updates for the same user cannot overwrite each other's step data.
+
         Args:
             user_id: The user's UUID
             step: New current step
             step_data: Optional data to store for this step
+            conn: Optional connection to run on instead of acquiring one from the pool
 
         Returns:
             Updated onboarding progress
@@ -145,25 +261,22 @@ class OnboardingRepository(BaseRepository[OnboardingProgressResponse]):
             RecordNotFoundError: If onboarding progress not found for user
             DatabaseError: For other database errors
         """
-        onboarding = await self.get_user_onboarding(user_id)
-        if not onboarding:
-            raise RecordNotFoundError(f"Onboarding progress not found for user {user_id}")
-
-        # Update onboarding data if step data provided
-        updated_data = onboarding.onboarding_data.copy()
-        if step_data:
-            updated_data[step.value] = step_data
+        step_value = _STEP_VALUES[step]
 
-        update_data = {
-            'current_step': step.value,
-            'onboarding_data': json.dumps(updated_data)
-        }
-
-        updated_onboarding = await self.update(onboarding.id, update_data)
-        if not updated_onboarding:
-            raise DatabaseError(f"Failed to update onboarding step for user {user_id}")
+        # Only replace this step's key when step data was provided
+        record = await self._fetch_one_with_error_handling(
+            _UPDATE_STEP_QUERY,
+            str(user_id),
+            step_value,
+            [step_value],
+            json.dumps(step_data) if step_data else None,
+            conn=conn
+        )
+        if not record:
+            raise RecordNotFoundError(f"Onboarding progress not found for user {user_id}")
 
-        return updated_onboarding
+        self.invalidate_cache(user_id)
+        return self._record_to_model(record)
 
     async def mark_step_completed(
         self,
@@ -219,11 +332,11 @@ class OnboardingRepository(BaseRepository[OnboardingProgressResponse]):
             raise RecordNotFoundError(f"Onboarding progress not found for user {user_id}")
 
         completed_steps = onboarding.completed_steps.copy()
-        if OnboardingStep.COMPLETED.value not in completed_steps:
-            completed_steps.append(OnboardingStep.COMPLETED.value)
+        if _COMPLETED_VALUE not in completed_steps:
+            completed_steps.append(_COMPLETED_VALUE)
 
         update_data = {
-            'current_step': OnboardingStep.COMPLETED.value,
+            'current_step': _COMPLETED_VALUE,
             'completed_steps': json.dumps(completed_steps),
             'is_completed': True,
             'completed_at': datetime.now()
@@ -268,28 +381,31 @@ class OnboardingRepository(BaseRepository[OnboardingProgressResponse]):
         """
         Get overall onboarding completion summary.
 
+        Reads the trigger-maintained onboarding_daily_stats roll-up (one row per
+        start date, see migration 009) instead of aggregating onboarding_progress.
+
         Returns:
             Dictionary with summary statistics
         """
         query = """
             SELECT
-                COUNT(*) as total_users,
-                COUNT(CASE WHEN is_completed = true THEN 1 END) as completed_users,
+                COALESCE(SUM(total_users), 0) as total_users,
+                COALESCE(SUM(completed_users), 0) as completed_users,
                 ROUND(
-                    COUNT(CASE WHEN is_completed = true THEN 1 END)::numeric /
-                    NULLIF(COUNT(*), 0) * 100, 2
+                    SUM(completed_users)::numeric /
+                    NULLIF(SUM(total_users), 0) * 100, 2
                 ) as completion_rate_percentage,
-                AVG(EXTRACT(EPOCH FROM (completed_at - started_at))/3600) as avg_completion_time_hours
-            FROM onboarding_progress
-            WHERE started_at >= CURRENT_DATE - INTERVAL '30 days'
+                SUM(completion_seconds) / NULLIF(SUM(timed_users), 0) / 3600 as avg_completion_time_hours
+            FROM onboarding_daily_stats
+            WHERE started_on >= CURRENT_DATE - 30
         """
 
         record = await self._fetch_one_with_error_handling(query)
 
         if record:
             return {
-                'total_users': record['total_users'],
-                'completed_users': record['completed_users'],
+                'total_users': int(record['total_users']),
+                'completed_users': int(record['completed_users']),
                 'completion_rate_percentage': float(record['completion_rate_percentage'] or 0),
                 'avg_completion_time_hours': float(record['avg_completion_time_hours'] or 0) if record['avg_completion_time_hours'] else None
             }
@@ -311,7 +427,7 @@ class OnboardingRepository(BaseRepository[OnboardingProgressResponse]):
         Returns:
             List of onboarding progress records for users on this step
         """
-        return await self.find_by_field('current_step', step.value)
+        return await self.find_by_field('current_step', _STEP_VALUES[step])
 
     async def get_completed_onboardings(self, limit: Optional[int] = None) -> List[OnboardingProgressResponse]:
         """
@@ -354,7 +470,7 @@ class OnboardingRepository(BaseRepository[OnboardingProgressResponse]):
             ORDER BY updated_at ASC
         """
 
-        records = await self._fetch_all_with_error_handling(query, step.value)
+        records = await self._fetch_all_with_error_handling(query, _STEP_VALUES[step])
         return [self._record_to_model(record) for record in records]
 
     async def update_onboarding_data(
@@ -386,29 +502,32 @@ class OnboardingRepository(BaseRepository[OnboardingProgressResponse]):
 
         return await self.update(onboarding.id, {'onboarding_data': json.dumps(updated_data)})
 
-    async def reset_onboarding(self, user_id: UUID) -> Optional[OnboardingProgressResponse]:
+    async def reset_onboarding(
+        self,
+        user_id: UUID,
+        conn: Optional[asyncpg.Connection] = None
+    ) -> Optional[OnboardingProgressResponse]:
         """
         Reset onboarding progress for a user.
 
+        A single INSERT ... ON CONFLICT (user_id) DO UPDATE, so the reset is atomic
+        and takes one round trip; a user without progress gets a fresh record.
+
         Args:
             user_id: The user's UUID
+            conn: Optional connection to run on instead of acquiring one from the pool
 
         Returns:
-            Reset onboarding progress if found
+            Reset onboarding progress
         """
-        onboarding = await self.get_user_onboarding(user_id)
-        if not onboarding:
-            return None
-
-        reset_data = {
-            'current_step': OnboardingStep.WELCOME.value,
-            'completed_steps': json.dumps([]),
-            'onboarding_data': json.dumps({}),
-            'is_completed': False,
-            'completed_at': None
-        }
+        record = await self._fetch_one_with_error_handling(
+            _RESET_QUERY, str(user_id), _WELCOME_VALUE, conn=conn
+        )
+        self.invalidate_cache(user_id)
 
-        return await self.update(onboarding.id, reset_data)
+        if record:
+            return self._record_to_model(record)
+        return None
 
     # Analytics-specific methods
     async def create_onboarding_analytics(self, analytics_data: OnboardingAnalyticsCreate) -> OnboardingAnalyticsResponse:
@@ -441,7 +560,7 @@ class OnboardingRepository(BaseRepository[OnboardingProgressResponse]):
         )
 
         try:
-            async with self.db_manager.get_connection() as conn:
+            async with self._acquire() as conn:
                 record = await conn.fetchrow(query, *values)
                 if record:
                     return OnboardingAnalyticsResponse(
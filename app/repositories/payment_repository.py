@@ -19,9 +19,9 @@ logger = logging.getLogger(__name__)
 class PaymentRepository(BaseRepository[PaymentInDB]):
     """Repository for payment operations"""
 
-    def __init__(self):
-        super().__init__("payment_history")
-        self.debt_repo = DebtRepository()
+    def __init__(self, pool: Optional[asyncpg.Pool] = None):
+        super().__init__("payment_history", pool=pool)
+        self.debt_repo = DebtRepository(pool=pool)
 
     def _record_to_model(self, record: asyncpg.Record) -> PaymentInDB:
         """Convert database record to PaymentInDB model"""
@@ -89,7 +89,7 @@ class PaymentRepository(BaseRepository[PaymentInDB]):
         
         # Use transaction to create payment and update debt balance
         try:
-            async with self.db_manager.get_connection() as conn:
+            async with self._acquire() as conn:
                 async with conn.transaction():
                     # Create payment
                     payment_dict = self._model_to_dict(payment_in_db)
@@ -564,62 +564,58 @@ class PaymentRepository(BaseRepository[PaymentInDB]):
         """
         Create multiple payments in a single transaction.
         
+        The payments go in with one multi-row INSERT, and debt balances are reduced
+        by one UPDATE covering every debt that received principal.
+        
         Args:
             payments: List of payment creation data
             
         Returns:
-            List of created payments
-        """
-        created_payments = []
+            List of created payments, in the same order as payments
+        """
+        payments_in_db = [
+            PaymentInDB(
+                debt_id=payment_create.debt_id,
+                user_id=payment_create.user_id,
+                amount=payment_create.amount,
+                payment_date=payment_create.payment_date,
+                principal_portion=payment_create.principal_portion,
+                interest_portion=payment_create.interest_portion,
+                notes=payment_create.notes,
+                status=payment_create.status,
+                created_at=datetime.now(),
+                updated_at=datetime.now()
+            )
+            for payment_create in payments
+        ]
+        principal_payments = [
+            payment_create for payment_create in payments
+            if payment_create.principal_portion and payment_create.principal_portion > 0
+        ]
         
         try:
-            async with self.db_manager.get_connection() as conn:
+            async with self._acquire() as conn:
                 async with conn.transaction():
-                    for payment_create in payments:
-                        payment_in_db = PaymentInDB(
-                            debt_id=payment_create.debt_id,
-                            user_id=payment_create.user_id,
-                            amount=payment_create.amount,
-                            payment_date=payment_create.payment_date,
-                            principal_portion=payment_create.principal_portion,
-                            interest_portion=payment_create.interest_portion,
-                            notes=payment_create.notes,
-                            status=payment_create.status,
-                            created_at=datetime.now(),
-                            updated_at=datetime.now()
-                        )
-                        
-                        # Insert payment
-                        payment_dict = self._model_to_dict(payment_in_db)
-                        insert_data = {k: v for k, v in payment_dict.items() if v is not None}
-                        
-                        columns = list(insert_data.keys())
-                        placeholders = [f"${i+1}" for i in range(len(columns))]
-                        values = list(insert_data.values())
-                        
-                        payment_query = f"""
-                            INSERT INTO payment_history ({', '.join(columns)})
-                            VALUES ({', '.join(placeholders)})
-                            RETURNING *
+                    created_payments = await self.bulk_create(payments_in_db, conn=conn)
+                    
+                    # Update debt balances for every payment with a principal portion
+                    if principal_payments:
+                        balance_query = """
+                            UPDATE debts 
+                            SET current_balance = debts.current_balance - paid.principal, updated_at = $3
+                            FROM (
+                                SELECT debt_id, SUM(principal) AS principal
+                                FROM unnest($1::uuid[], $2::numeric[]) AS p(debt_id, principal)
+                                GROUP BY debt_id
+                            ) AS paid
+                            WHERE debts.id = paid.debt_id
                         """
-                        
-                        payment_record = await conn.fetchrow(payment_query, *values)
-                        created_payment = self._record_to_model(payment_record)
-                        created_payments.append(created_payment)
-                        
-                        # Update debt balance if principal portion is specified
-                        if payment_create.principal_portion and payment_create.principal_portion > 0:
-                            balance_query = """
-                                UPDATE debts 
-                                SET current_balance = current_balance - $1, updated_at = $2
-                                WHERE id = $3
-                            """
-                            await conn.execute(
-                                balance_query, 
-                                payment_create.principal_portion, 
-                                datetime.now(),
-                                str(payment_create.debt_id)
-                            )
+                        await conn.execute(
+                            balance_query,
+                            [str(payment_create.debt_id) for payment_create in principal_payments],
+                            [payment_create.principal_portion for payment_create in principal_payments],
+                            datetime.now()
+                        )
             
             return created_payments
             
@@ -18,8 +18,8 @@ logger = logging.getLogger(__name__)
 class UserRepository(BaseRepository[UserInDB]):
     """Repository for user operations"""
 
-    def __init__(self):
-        super().__init__("users")
+    def __init__(self, pool: Optional[asyncpg.Pool] = None):
+        super().__init__("users", pool=pool)
 
     def _record_to_model(self, record: asyncpg.Record) -> UserInDB:
         """Convert database record to UserInDB model"""
@@ -391,5 +391,25 @@ class UserRepository(BaseRepository[UserInDB]):
         
         return None
 
+    async def get_first_user_with_debts(self) -> Optional[UserInDB]:
+        """
+        Get the most recently created user that has at least one active debt.
+        
+        Returns:
+            User if one has active debts, None otherwise
+        """
+        query = """
+            SELECT u.* FROM users u
+            WHERE EXISTS (
+                SELECT 1 FROM debts d
+                WHERE d.user_id = u.id AND d.is_active = true
+            )
+            ORDER BY u.created_at DESC
+            LIMIT 1
+        """
+        
+        record = await self._fetch_one_with_error_handling(query)
+        return self._record_to_model(record) if record else None
+
 
 
@@ -3,6 +3,7 @@ New debt management API endpoints using repository pattern and enhanced models.
 Provides RESTful API for debt management that exactly matches frontend expectations.
 """
 
+import logging
 from typing import List, Optional, Dict, Any
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from pydantic import BaseModel, Field
@@ -26,6 +27,8 @@ from app.services.ai_insights_cache_service import AIInsightsCacheService
 from app.databases.database import get_db, get_sqlalchemy_session
 from sqlalchemy.ext.asyncio import AsyncSession
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
 
@@ -45,6 +48,16 @@ class PaymentRecordRequest(BaseModel):
     notes: Optional[str] = Field(None, max_length=1000, description="Payment notes")
 
 
+class BulkDebtCreateRequest(BaseModel):
+    """Request model for creating several debts in one call"""
+    debts: List[DebtCreateRequest] = Field(..., min_length=1, max_length=50, description="Debts to create")
+
+
+class BulkDebtDeleteRequest(BaseModel):
+    """Request model for deleting several debts in one call"""
+    ids: List[UUID] = Field(..., min_length=1, max_length=100, description="IDs of the debts to delete")
+
+
 class PaymentRecordResponse(BaseModel):
     """Response model for payment recording with celebration data"""
     payment: PaymentHistoryResponse = Field(..., description="Payment details")
@@ -128,23 +141,7 @@ async def create_debt(
 
     try:
         # Create DebtCreate model with user_id from authenticated user
-        debt_data = DebtCreate(
-            user_id=current_user.id,
-            name=debt_request.name,
-            debt_type=debt_request.debt_type,
-            principal_amount=debt_request.principal_amount,
-            current_balance=debt_request.current_balance,
-            interest_rate=debt_request.interest_rate,
-            is_variable_rate=debt_request.is_variable_rate,
-            minimum_payment=debt_request.minimum_payment,
-            due_date=debt_request.due_date,
-            lender=debt_request.lender,
-            remaining_term_months=debt_request.remaining_term_months,
-            is_tax_deductible=debt_request.is_tax_deductible,
-            payment_frequency=debt_request.payment_frequency,
-            is_high_priority=debt_request.is_high_priority,
-            notes=debt_request.notes
-        )
+        debt_data = _to_debt_create(debt_request, current_user.id)
 
         # Create the debt
         new_debt = await debt_repo.create_debt(debt_data)
@@ -175,6 +172,43 @@ async def create_debt(
         )
 
 
+@router.post("/bulk", response_model=List[DebtResponse], status_code=status.HTTP_201_CREATED)
+async def bulk_create_debts(
+    bulk_request: BulkDebtCreateRequest,
+    current_user: CurrentUser,
+    ai_cache_service: AIInsightsCacheService = Depends(get_ai_cache_service)
+) -> List[DebtResponse]:
+    """
+    Create several debts for the current user in one transaction.
+    Either every debt is created or none is; results keep the request order.
+    """
+    debt_repo = DebtRepository()
+
+    try:
+        new_debts = await debt_repo.bulk_create_debts([
+            _to_debt_create(debt_request, current_user.id)
+            for debt_request in bulk_request.debts
+        ])
+
+        # Invalidate AI insights cache once for the whole batch
+        try:
+            await ai_cache_service.invalidate_cache_for_user(current_user.id)
+        except Exception as e:
+            # Log cache invalidation error but don't fail the operation
+            logger.warning(f"Cache invalidation failed for user {current_user.id}: {e}")
+
+        return [DebtResponse.from_debt_in_db(debt) for debt in new_debts]
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.exception(f"Bulk debt creation failed for user {current_user.id}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to create debts: {str(e)}"
+        )
+
+
 @router.get("/summary", response_model=AnalyticsDebtSummaryResponse)
 async def get_debt_summary(
     current_user: CurrentUser
@@ -440,6 +474,38 @@ async def delete_debt(
         )
 
 
+@router.post("/bulk-delete", status_code=status.HTTP_204_NO_CONTENT)
+async def bulk_delete_debts(
+    bulk_request: BulkDebtDeleteRequest,
+    current_user: CurrentUser,
+    ai_cache_service: AIInsightsCacheService = Depends(get_ai_cache_service)
+) -> None:
+    """
+    Delete several debts in one round-trip.
+    Only the current user's debts are deleted; other ids are ignored.
+    """
+    debt_repo = DebtRepository()
+
+    try:
+        deleted_ids = await debt_repo.bulk_delete_debts(current_user.id, bulk_request.ids)
+
+        # Invalidate AI insights cache once for the whole batch
+        if deleted_ids:
+            try:
+                await ai_cache_service.invalidate_cache_for_user(current_user.id)
+            except Exception as e:
+                # Log cache invalidation error but don't fail the operation
+                logger.warning(f"Cache invalidation failed for user {current_user.id}: {e}")
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to delete debts: {str(e)}"
+        )
+
+
 @router.post("/{debt_id}/payment", response_model=PaymentRecordResponse)
 async def record_payment(
     debt_id: UUID,
@@ -543,6 +609,27 @@ async def record_payment(
 
 
 
+def _to_debt_create(debt_request: DebtCreateRequest, user_id: UUID) -> DebtCreate:
+    """Build a DebtCreate for the authenticated user from a request body"""
+    return DebtCreate(
+        user_id=user_id,
+        name=debt_request.name,
+        debt_type=debt_request.debt_type,
+        principal_amount=debt_request.principal_amount,
+        current_balance=debt_request.current_balance,
+        interest_rate=debt_request.interest_rate,
+        is_variable_rate=debt_request.is_variable_rate,
+        minimum_payment=debt_request.minimum_payment,
+        due_date=debt_request.due_date,
+        lender=debt_request.lender,
+        remaining_term_months=debt_request.remaining_term_months,
+        is_tax_deductible=debt_request.is_tax_deductible,
+        payment_frequency=debt_request.payment_frequency,
+        is_high_priority=debt_request.is_high_priority,
+        notes=debt_request.notes
+    )
+
+
 async def _generate_celebration_data(
     payment, updated_debt, previous_balance: float
 ) -> Dict[str, Any]:
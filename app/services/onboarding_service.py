@@ -51,6 +51,20 @@ class OnboardingService:
         self.goals_repo = goals_repo
         self.user_repo = user_repo
 
+    def _build_status(self, onboarding) -> Dict[str, Any]:
+        """Build the frontend status payload for an onboarding row"""
+        return {
+            "id": str(onboarding.id),
+            "user_id": str(onboarding.user_id),
+            "current_step": onboarding.current_step.value,
+            "completed_steps": onboarding.completed_steps,
+            "onboarding_data": onboarding.onboarding_data,
+            "is_completed": onboarding.is_completed,
+            "progress_percentage": onboarding.progress_percentage,
+            "started_at": onboarding.started_at.isoformat() if onboarding.started_at else None,
+            "completed_at": onboarding.completed_at.isoformat() if onboarding.completed_at else None
+        }
+
     async def start_onboarding(self, user_id: UUID) -> Dict[str, Any]:
         """
         Initialize onboarding process for a new user.
@@ -76,8 +90,8 @@ class OnboardingService:
                         step=OnboardingStep.COMPLETED
                     )
                 else:
-                    # Return existing onboarding status
-                    return await self.get_onboarding_status(user_id)
+                    # Return existing onboarding status from the row already fetched
+                    return self._build_status(existing_onboarding)
 
             # Create new onboarding progress
             onboarding_progress = await self.onboarding_repo.create_onboarding_progress(user_id)
@@ -133,17 +147,7 @@ class OnboardingService:
                 }
 
             # Return existing onboarding data in frontend-compatible format
-            return {
-                "id": str(onboarding.id),
-                "user_id": str(onboarding.user_id),
-                "current_step": onboarding.current_step.value,
-                "completed_steps": onboarding.completed_steps,
-                "onboarding_data": onboarding.onboarding_data,
-                "is_completed": onboarding.is_completed,
-                "progress_percentage": onboarding.progress_percentage,
-                "started_at": onboarding.started_at.isoformat() if onboarding.started_at else None,
-                "completed_at": onboarding.completed_at.isoformat() if onboarding.completed_at else None
-            }
+            return self._build_status(onboarding)
 
         except Exception as e:
             logger.error(f"Failed to get onboarding status for user {user_id}: {e}")
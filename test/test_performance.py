@@ -6,23 +6,78 @@ Tests response times, throughput, and resource usage.
 import pytest
 import time
 import asyncio
-from statistics import mean, median
-from typing import List, Dict, Any
-import psutil
-import os
+from statistics import mean, median, quantiles
+from typing import Any, Awaitable, Callable, Dict, List, Tuple
+import tracemalloc
+from datetime import datetime
+from types import SimpleNamespace
+from uuid import UUID, uuid4
+
+from app.models.onboarding import OnboardingStep
+from app.repositories.debt_repository import DebtRepository
+from app.services.onboarding_service import OnboardingService
+
+NS_PER_SECOND = 1_000_000_000
+
+BENCHMARK_ROUNDS = 5
+BENCHMARK_WARMUP_ROUNDS = 1
+
+# Requests kept in flight at once by test_sustained_api_load
+SUSTAINED_LOAD_CONCURRENCY = 8
+
+
+async def _measure_rounds(
+    request: Callable[[int], Awaitable[Any]],
+    rounds: int = BENCHMARK_ROUNDS,
+    warmup_rounds: int = BENCHMARK_WARMUP_ROUNDS
+) -> Tuple[float, List[Any]]:
+    """
+    Await request(i) for warmup_rounds + rounds calls and time each measured call.
+
+    pytest-benchmark cannot drive coroutines, so the rounds are timed here. Returns the
+    median of the measured rounds together with every response (warmup included, in
+    call order).
+    """
+    timings_ns = []
+    responses = []
+    for i in range(warmup_rounds + rounds):
+        start_time = time.perf_counter_ns()
+        responses.append(await request(i))
+        if i >= warmup_rounds:
+            timings_ns.append(time.perf_counter_ns() - start_time)
+    return median(timings_ns) / NS_PER_SECOND, responses
+
+
+@pytest.fixture
+def authenticated_user(session_user, session_cookie) -> Dict[str, Any]:
+    """Session-wide user with a per-test session token (shadows the conftest fixture)."""
+    return {
+        "user": session_user,
+        "session_token": session_cookie
+    }
+
+
+@pytest.fixture(autouse=True)
+def _authenticate_client(test_client, authenticated_user):
+    """Set the shared user's session cookie on every test's client."""
+    test_client.cookies.set("session_token", authenticated_user["session_token"])
+
+
+@pytest.fixture
+def test_debts(session_debts):
+    """Debts seeded once per session for the shared user (shadows the conftest fixture)."""
+    return session_debts
 
 
 @pytest.mark.performance
 class TestAPIResponseTimes:
     """Test API endpoint response times."""
 
-    async def test_debt_crud_response_times(self, test_client, authenticated_user, benchmark):
-        """Test response times for debt CRUD operations."""
-        # Set session cookie
-        test_client.cookies.set("session_token", authenticated_user["session_token"])
+    async def test_debt_crud_response_times(self, test_client, authenticated_user):
+        """Test median response times for debt CRUD operations."""
         user_id = str(authenticated_user["user"].id)
 
-        # Test CREATE response time
+        # Test CREATE response time (one debt per round, reused by the DELETE rounds)
         debt_data = {
             "user_id": user_id,
             "name": "Performance Test Debt",
@@ -36,66 +91,64 @@ class TestAPIResponseTimes:
             "payment_frequency": "monthly"
         }
 
-        start_time = time.time()
-        create_response = await test_client.post("/api/v2/debts", json=debt_data)
-        create_time = time.time() - start_time
+        create_time, create_responses = await _measure_rounds(
+            lambda _: test_client.post("/api/v2/debts", json=debt_data)
+        )
 
-        assert create_response.status_code == 201
-        assert create_time < 0.5  # Should be under 500ms
+        assert all(r.status_code == 201 for r in create_responses)
+        assert create_time < 0.25  # Median should be under 250ms
 
-        debt_id = create_response.json()["id"]
+        debt_ids = [r.json()["id"] for r in create_responses]
+        debt_id = debt_ids[0]
 
         # Test READ response time
-        start_time = time.time()
-        read_response = await test_client.get(f"/api/v2/debts/{debt_id}")
-        read_time = time.time() - start_time
+        read_time, read_responses = await _measure_rounds(
+            lambda _: test_client.get(f"/api/v2/debts/{debt_id}")
+        )
 
-        assert read_response.status_code == 200
-        assert read_time < 0.2  # Should be under 200ms
+        assert all(r.status_code == 200 for r in read_responses)
+        assert read_time < 0.1  # Median should be under 100ms
 
         # Test UPDATE response time
         update_data = {"current_balance": 2500.0}
-        start_time = time.time()
-        update_response = await test_client.put(f"/api/v2/debts/{debt_id}", json=update_data)
-        update_time = time.time() - start_time
+        update_time, update_responses = await _measure_rounds(
+            lambda _: test_client.put(f"/api/v2/debts/{debt_id}", json=update_data)
+        )
 
-        assert update_response.status_code == 200
-        assert update_time < 0.3  # Should be under 300ms
+        assert all(r.status_code == 200 for r in update_responses)
+        assert update_time < 0.15  # Median should be under 150ms
 
         # Test DELETE response time
-        start_time = time.time()
-        delete_response = await test_client.delete(f"/api/v2/debts/{debt_id}")
-        delete_time = time.time() - start_time
+        delete_time, delete_responses = await _measure_rounds(
+            lambda i: test_client.delete(f"/api/v2/debts/{debt_ids[i]}")
+        )
 
-        assert delete_response.status_code == 204
-        assert delete_time < 0.3  # Should be under 300ms
+        assert all(r.status_code == 204 for r in delete_responses)
+        assert delete_time < 0.15  # Median should be under 150ms
 
-    async def test_ai_response_times(self, test_client, authenticated_user, test_debts):
+    async def test_ai_response_times(self, test_client, test_debts):
         """Test response times for AI operations."""
-        # Set session cookie
-        test_client.cookies.set("session_token", authenticated_user["session_token"])
-
         # Test AI insights response time (may be cached)
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         insights_response = await test_client.get("/api/ai/insights")
-        insights_time = time.time() - start_time
+        insights_time = (time.perf_counter_ns() - start_time) / NS_PER_SECOND
 
         assert insights_response.status_code == 200
         # AI operations can be slower but should be reasonable
         assert insights_time < 5.0  # Should be under 5 seconds
 
         # Test DTI calculation response time
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         dti_response = await test_client.get("/api/ai/dti")
-        dti_time = time.time() - start_time
+        dti_time = (time.perf_counter_ns() - start_time) / NS_PER_SECOND
 
         assert dti_response.status_code == 200
         assert dti_time < 2.0  # Should be under 2 seconds
 
         # Test recommendations response time
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         rec_response = await test_client.get("/api/ai/recommendations")
-        rec_time = time.time() - start_time
+        rec_time = (time.perf_counter_ns() - start_time) / NS_PER_SECOND
 
         assert rec_response.status_code == 200
         assert rec_time < 1.0  # Should be under 1 second
@@ -105,14 +158,13 @@ class TestAPIResponseTimes:
 class TestConcurrentRequests:
     """Test handling of concurrent requests."""
 
-    async def test_concurrent_debt_operations(self, test_client, authenticated_user):
+    async def test_concurrent_debt_operations(self, test_client, authenticated_user, db_pool):
         """Test concurrent debt operations."""
-        # Set session cookie
-        test_client.cookies.set("session_token", authenticated_user["session_token"])
-        user_id = str(authenticated_user["user"].id)
+        user = authenticated_user["user"]
+        user_id = str(user.id)
 
-        async def create_debt_request(index: int):
-            debt_data = {
+        def debt_payload(index: int) -> Dict[str, Any]:
+            return {
                 "user_id": user_id,
                 "name": f"Concurrent Debt {index}",
                 "debt_type": "credit_card",
@@ -125,42 +177,51 @@ class TestConcurrentRequests:
                 "payment_frequency": "monthly"
             }
 
-            start_time = time.time()
-            response = await test_client.post("/api/v2/debts", json=debt_data)
-            end_time = time.time()
+        async def bulk_create_request(batch: List[Dict[str, Any]]):
+            start_time = time.perf_counter_ns()
+            response = await test_client.post("/api/v2/debts/bulk", json={"debts": batch})
+            end_time = time.perf_counter_ns()
 
             return {
                 "status_code": response.status_code,
-                "response_time": end_time - start_time,
-                "success": response.status_code == 201
+                "response_time": (end_time - start_time) / NS_PER_SECOND,
+                "debts": response.json() if response.status_code == 201 else []
             }
 
-        # Create 10 concurrent requests
-        tasks = [create_debt_request(i) for i in range(10)]
-        results = await asyncio.gather(*tasks)
-
-        # Analyze results
-        successful_requests = sum(1 for r in results if r["success"])
-        avg_response_time = mean(r["response_time"] for r in results)
-        max_response_time = max(r["response_time"] for r in results)
-
-        assert successful_requests == 10, f"Expected 10 successful requests, got {successful_requests}"
-        assert avg_response_time < 1.0, f"Average response time too high: {avg_response_time}"
-        assert max_response_time < 2.0, f"Max response time too high: {max_response_time}"
-
-    async def test_concurrent_ai_requests(self, test_client, authenticated_user, test_debts):
+        # Create 10 debts as 2 concurrent bulk requests of 5
+        debts = [debt_payload(i) for i in range(10)]
+        results = await asyncio.gather(
+            bulk_create_request(debts[:5]),
+            bulk_create_request(debts[5:])
+        )
+
+        created = [debt for r in results for debt in r["debts"]]
+        try:
+            # Analyze results
+            assert all(r["status_code"] == 201 for r in results)
+            avg_response_time = mean(r["response_time"] for r in results)
+            max_response_time = max(r["response_time"] for r in results)
+
+            assert len(created) == 10, f"Expected 10 created debts, got {len(created)}"
+            assert [debt["name"] for debt in created] == [debt["name"] for debt in debts]
+            assert avg_response_time < 1.0, f"Average response time too high: {avg_response_time}"
+            assert max_response_time < 2.0, f"Max response time too high: {max_response_time}"
+        finally:
+            # Keep the session user's debts unchanged for the tests that read them
+            await DebtRepository(pool=db_pool).bulk_delete_debts(
+                user.id, [UUID(debt["id"]) for debt in created]
+            )
+
+    async def test_concurrent_ai_requests(self, test_client, test_debts):
         """Test concurrent AI insights requests."""
-        # Set session cookie
-        test_client.cookies.set("session_token", authenticated_user["session_token"])
-
         async def ai_request():
-            start_time = time.time()
+            start_time = time.perf_counter_ns()
             response = await test_client.get("/api/ai/insights")
-            end_time = time.time()
+            end_time = time.perf_counter_ns()
 
             return {
                 "status_code": response.status_code,
-                "response_time": end_time - start_time,
+                "response_time": (end_time - start_time) / NS_PER_SECOND,
                 "success": response.status_code == 200
             }
 
@@ -180,39 +241,65 @@ class TestConcurrentRequests:
 class TestResourceUsage:
     """Test resource usage during operations."""
 
-    def test_memory_usage_during_operations(self):
-        """Test memory usage during various operations."""
-        process = psutil.Process(os.getpid())
-        initial_memory = process.memory_info().rss / 1024 / 1024  # MB
-
-        # Perform some memory-intensive operations
-        large_data = [{"data": "x" * 1000} for _ in range(1000)]
-
-        # Check memory after operations
-        after_memory = process.memory_info().rss / 1024 / 1024  # MB
-        memory_increase = after_memory - initial_memory
-
-        # Memory increase should be reasonable (less than 50MB)
-        assert memory_increase < 50, f"Memory increase too high: {memory_increase}MB"
-
-    async def test_database_connection_pooling(self, test_client, authenticated_user):
+    async def test_memory_usage_during_operations(self):
+        """Test peak Python allocations while serving onboarding status lookups."""
+        onboarding = SimpleNamespace(
+            id=uuid4(),
+            user_id=uuid4(),
+            current_step=OnboardingStep.DEBT_COLLECTION,
+            completed_steps=["welcome", "profile_setup"],
+            onboarding_data={"profile": {"monthly_income": 50000}},
+            is_completed=False,
+            progress_percentage=50.0,
+            started_at=datetime.now(),
+            completed_at=None
+        )
+
+        class OnboardingRepoStub:
+            # Plain coroutine instead of AsyncMock, which records every call it receives
+            async def get_user_onboarding(self, user_id):
+                return onboarding
+
+        service = OnboardingService(
+            onboarding_repo=OnboardingRepoStub(),
+            goals_repo=None,
+            user_repo=None
+        )
+
+        tracemalloc.start()
+        try:
+            baseline = tracemalloc.get_traced_memory()[0]
+            for _ in range(1000):
+                await service.get_onboarding_status(onboarding.user_id)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+        # Each status dict is dropped after the call, so peak growth should stay small
+        memory_increase = (peak - baseline) / 1024 / 1024  # MB
+        assert memory_increase < 5, f"Peak memory increase too high: {memory_increase:.2f}MB"
+
+    async def test_database_connection_pooling(self, test_client):
         """Test database connection pooling under load."""
-        # Set session cookie
-        test_client.cookies.set("session_token", authenticated_user["session_token"])
-
-        # Make multiple rapid requests to test connection pooling
-        start_time = time.time()
-
-        responses = []
-        for _ in range(20):
+        async def timed_request() -> Tuple[int, int]:
+            request_start = time.perf_counter_ns()
             response = await test_client.get("/api/v2/debts")
-            responses.append(response.status_code)
+            return response.status_code, time.perf_counter_ns() - request_start
 
-        end_time = time.time()
-        total_time = end_time - start_time
+        # Issue the requests concurrently so the pool sees overlapping checkouts
+        start_time = time.perf_counter_ns()
+        results = await asyncio.gather(*[timed_request() for _ in range(20)])
+        end_time = time.perf_counter_ns()
+        total_time = (end_time - start_time) / NS_PER_SECOND
+
+        responses, response_times_ns = zip(*results)
 
         # All requests should succeed
-        assert all(code == 200 for code in responses)
+        assert set(responses) == {200}, responses
+
+        # Queueing for a connection would show up as a latency spike in the tail
+        p95_response_time = quantiles(response_times_ns, n=20)[-1] / NS_PER_SECOND
+        assert p95_response_time < 2.0, f"p95 response time too high: {p95_response_time}s"
 
         # Total time should be reasonable (under 10 seconds for 20 requests)
         assert total_time < 10.0, f"Total request time too high: {total_time}s"
@@ -223,34 +310,34 @@ class TestResourceUsage:
 class TestLoadTesting:
     """Load testing for sustained performance."""
 
-    async def test_sustained_api_load(self, test_client, authenticated_user):
+    async def test_sustained_api_load(self, test_client):
         """Test sustained API load over time."""
-        # Set session cookie
-        test_client.cookies.set("session_token", authenticated_user["session_token"])
+        semaphore = asyncio.Semaphore(SUSTAINED_LOAD_CONCURRENCY)
 
-        response_times = []
-        start_time = time.time()
+        async def timed_request() -> Tuple[int, int]:
+            async with semaphore:
+                request_start = time.perf_counter_ns()
+                response = await test_client.get("/api/v2/debts")
+                request_end = time.perf_counter_ns()
 
-        # Make 50 requests over 30 seconds
-        for i in range(50):
-            request_start = time.time()
-            response = await test_client.get("/api/v2/debts")
-            request_end = time.time()
+            return response.status_code, request_end - request_start
+
+        start_time = time.perf_counter_ns()
 
-            assert response.status_code == 200
-            response_times.append(request_end - request_start)
+        # Make 50 requests with at most SUSTAINED_LOAD_CONCURRENCY in flight
+        results = await asyncio.gather(*[timed_request() for _ in range(50)])
 
-            # Small delay to simulate real usage
-            await asyncio.sleep(0.1)
+        end_time = time.perf_counter_ns()
+        total_duration = (end_time - start_time) / NS_PER_SECOND
 
-        end_time = time.time()
-        total_duration = end_time - start_time
+        status_codes, response_times_ns = zip(*results)
+        assert set(status_codes) == {200}, status_codes
 
-        # Analyze performance metrics
-        avg_response_time = mean(response_times)
-        median_response_time = median(response_times)
-        max_response_time = max(response_times)
-        min_response_time = min(response_times)
+        # Analyze performance metrics (integer nanoseconds until here)
+        avg_response_time = mean(response_times_ns) / NS_PER_SECOND
+        median_response_time = median(response_times_ns) / NS_PER_SECOND
+        max_response_time = max(response_times_ns) / NS_PER_SECOND
+        min_response_time = min(response_times_ns) / NS_PER_SECOND
 
         # Performance assertions
         assert avg_response_time < 0.5, f"Average response time too high: {avg_response_time}s"
@@ -258,7 +345,7 @@ class TestLoadTesting:
         assert max_response_time < 2.0, f"Max response time too high: {max_response_time}s"
 
         # Throughput check (should handle at least 1 request per second)
-        throughput = len(response_times) / total_duration
+        throughput = len(response_times_ns) / total_duration
         assert throughput > 1.0, f"Throughput too low: {throughput} req/s"
 
 
@@ -266,22 +353,19 @@ class TestLoadTesting:
 class TestCachingPerformance:
     """Test caching performance improvements."""
 
-    async def test_ai_caching_performance(self, test_client, authenticated_user, test_debts):
+    async def test_ai_caching_performance(self, test_client, test_debts):
         """Test AI caching performance improvements."""
-        # Set session cookie
-        test_client.cookies.set("session_token", authenticated_user["session_token"])
-
         # First request (cache miss)
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         response1 = await test_client.get("/api/ai/insights")
-        first_request_time = time.time() - start_time
+        first_request_time = (time.perf_counter_ns() - start_time) / NS_PER_SECOND
 
         assert response1.status_code == 200
 
         # Second request (cache hit)
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         response2 = await test_client.get("/api/ai/insights")
-        second_request_time = time.time() - start_time
+        second_request_time = (time.perf_counter_ns() - start_time) / NS_PER_SECOND
 
         assert response2.status_code == 200
 
@@ -292,29 +376,26 @@ class TestCachingPerformance:
         # Both responses should be identical
         assert response1.json() == response2.json()
 
-    async def test_cache_invalidation_performance(self, test_client, authenticated_user, test_debts):
+    async def test_cache_invalidation_performance(self, test_client, mutable_debts):
         """Test cache invalidation doesn't hurt performance significantly."""
-        # Set session cookie
-        test_client.cookies.set("session_token", authenticated_user["session_token"])
-
         # Get cached insights
         await test_client.get("/api/ai/insights")
 
         # Modify debt (should invalidate cache)
-        debt_id = str(test_debts[0].id)
-        update_data = {"current_balance": test_debts[0].current_balance - 50}
+        debt_id = str(mutable_debts[0].id)
+        update_data = {"current_balance": mutable_debts[0].current_balance - 50}
 
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         update_response = await test_client.put(f"/api/v2/debts/{debt_id}", json=update_data)
-        update_time = time.time() - start_time
+        update_time = (time.perf_counter_ns() - start_time) / NS_PER_SECOND
 
         assert update_response.status_code == 200
         assert update_time < 0.5  # Cache invalidation should not significantly slow down updates
 
         # Next AI request should generate fresh results
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         fresh_response = await test_client.get("/api/ai/insights")
-        fresh_request_time = time.time() - start_time
+        fresh_request_time = (time.perf_counter_ns() - start_time) / NS_PER_SECOND
 
         assert fresh_response.status_code == 200
         # Fresh request should still be reasonably fast
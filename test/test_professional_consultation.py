@@ -3,17 +3,223 @@ Demonstration of Professional AI Consultation Features
 Shows the enhanced professional recommendations, repayment plans, and risk assessments
 """
 
-import asyncio
-import json
 import logging
-from datetime import datetime
-from uuid import uuid4
-from typing import Dict, Any
+from dataclasses import dataclass
+from typing import Dict, Any, Tuple
 
 # Setup logging
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
 logger = logging.getLogger(__name__)
 
+# Section separators, built once at import
+_SEP40 = "-" * 40
+_SEP60 = "=" * 60
+_SEP80 = "=" * 80
+
+# Per-item display blocks; one format call renders a whole recommendation or risk factor
+_REC_TEMPLATE = (
+    "\n📋 {rec.title}\n"
+    "   Priority: {rec.priority}/10 | Type: {rec.type}\n"
+    "   💰 Potential Savings: ${rec.potentialSavings:,}\n"
+    "   ⏱️  Timeline: {rec.timeline}\n"
+    "   📈 Benefits: {benefits_str}"
+)
+_FACTOR_TEMPLATE = (
+    "   • {label}\n"
+    "     Impact: {factor.impact}\n"
+    "     Mitigation: {factor.mitigation}"
+)
+
+
+@dataclass(frozen=True, slots=True)
+class Recommendation:
+    """One example professional recommendation"""
+    id: str
+    type: str
+    title: str
+    description: str
+    priority: int
+    actionSteps: Tuple[str, ...]
+    timeline: str
+    benefits: Tuple[str, ...]
+    risks: Tuple[str, ...]
+    potentialSavings: int
+
+
+@dataclass(frozen=True, slots=True)
+class RiskFactor:
+    """One example risk assessment factor"""
+    category: str
+    impact: str
+    mitigation: str
+
+# Display labels for the known risk factor categories
+_CATEGORY_LABELS = {
+    "high_interest_debt": "High Interest Debt",
+    "debt_burden": "Debt Burden",
+    "emergency_preparedness": "Emergency Preparedness",
+}
+
+# Fixed sample debt IDs so repeated runs produce identical output
+_DEBT_IDS = (
+    "11111111-1111-4111-8111-111111111111",
+    "22222222-2222-4222-8222-222222222222",
+    "33333333-3333-4333-8333-333333333333",
+    "44444444-4444-4444-8444-444444444444",
+)
+
+# Example professional recommendations that would be generated
+_RECOMMENDATIONS = (
+    Recommendation(
+        id="prof_rec_1",
+        type="emergency_fund",
+        title="Build Emergency Fund Foundation",
+        description="Establish $10,000 emergency fund before aggressive debt payoff to prevent debt relapse during unexpected expenses",
+        priority=10,
+        actionSteps=(
+            "Open high-yield savings account (Marcus, Ally, or similar)",
+            "Calculate monthly expenses ($5,000 estimated)",
+            "Set automatic transfer of $500/month to emergency savings",
+            "Build starter $2,000 fund first, then continue to $10,000"
+        ),
+        timeline="Foundation Phase (Months 1-4)",
+        benefits=(
+            "Prevents debt accumulation during emergencies",
+            "Provides financial security and peace of mind",
+            "Creates foundation for wealth building"
+        ),
+        risks=("Opportunity cost vs debt payoff",),
+        potentialSavings=5000  # Estimated value of avoiding future debt
+    ),
+    Recommendation(
+        id="prof_rec_2",
+        type="avalanche",
+        title="Eliminate High-Interest Credit Card Debt",
+        description="Focus all extra payments on Chase Freedom card (24.99% APR) to minimize total interest paid over loan lifetime",
+        priority=9,
+        actionSteps=(
+            "Allocate $595 extra payment to Chase Freedom card monthly",
+            "Continue minimum payments on all other debts",
+            "Set up automatic payment to avoid late fees",
+            "Track progress monthly and celebrate milestones"
+        ),
+        timeline="Acceleration Phase (Months 1-14)",
+        benefits=(
+            "Save $12,400 in interest costs over payoff period",
+            "Achieve debt freedom 18 months faster",
+            "Improve credit utilization ratio"
+        ),
+        risks=("Requires consistent discipline",),
+        potentialSavings=12400
+    ),
+    Recommendation(
+        id="prof_rec_3",
+        type="negotiation",
+        title="Negotiate Credit Card Interest Rate",
+        description="Contact Chase to negotiate lower APR based on payment history and market rates",
+        priority=8,
+        actionSteps=(
+            "Gather competing credit card offers",
+            "Call Chase retention department",
+            "Request rate reduction to 18-20% based on payment history",
+            "Document any agreements in writing"
+        ),
+        timeline="Immediate (Week 1)",
+        benefits=(
+            "Potential 5-7% rate reduction",
+            "Additional $1,800 in interest savings",
+            "No impact on credit score"
+        ),
+        risks=("No guarantee of approval",),
+        potentialSavings=1800
+    ),
+)
+
+# Example enhanced repayment plan
+_REPAYMENT_PLAN = {
+    "strategy": "avalanche",
+    "monthlyPayment": 1800,
+    "timeToFreedom": 52,  # months
+    "totalSavings": 18500,
+    "primaryStrategy": {
+        "name": "Debt Avalanche Plus Emergency Fund",
+        "description": "Mathematical optimal approach with financial security foundation",
+        "reasoning": "Your high credit card interest rate (24.99%) makes avalanche method optimal, saving $18,500 vs minimum payments",
+        "benefits": [
+            "Maximum interest savings ($18,500)",
+            "Debt freedom in 4.3 years vs 8+ years with minimums",
+            "Improved credit score through utilization reduction",
+            "Financial security through emergency fund"
+        ],
+        "timeline": 52
+    },
+    "alternativeStrategies": [
+        {
+            "name": "Debt Snowball",
+            "description": "Focus on smallest balances first for psychological wins",
+            "benefits": ["Quick early victories", "Motivational momentum"],
+            "timeline": 55
+        }
+    ],
+    "actionItems": [
+        "Transfer $500/month to emergency fund until $10,000 target",
+        "Pay $1,300/month toward debt elimination ($595 extra to Chase card)",
+        "Set up all payments as automatic transfers",
+        "Review progress monthly and adjust as needed"
+    ],
+    "keyInsights": [
+        "Emergency fund prevents debt relapse and provides peace of mind",
+        "Focus on Chase card saves $12,400 vs even payments across debts",
+        "Current DTI of 16% is healthy - you have room for debt acceleration",
+        "Completing this plan puts you in top 20% of financial health"
+    ],
+    "riskFactors": [
+        "Job loss or income reduction could impact plan",
+        "Large unexpected expenses might require plan adjustment",
+        "Interest rate increases on variable rate debts"
+    ]
+}
+
+# Example risk assessment
+_RISK_ASSESSMENT = {
+    "level": "moderate",
+    "score": 6,
+    "factors": (
+        RiskFactor(
+            category="high_interest_debt",
+            impact="24.99% credit card rate significantly above market average",
+            mitigation="Prioritize this debt for immediate payoff or rate negotiation"
+        ),
+        RiskFactor(
+            category="debt_burden",
+            impact="16% DTI is healthy but leaves room for optimization",
+            mitigation="Current income supports aggressive debt elimination plan"
+        ),
+        RiskFactor(
+            category="emergency_preparedness",
+            impact="No emergency fund data available",
+            mitigation="Build 3-6 month emergency fund to prevent debt relapse"
+        )
+    )
+}
+
+# Example consultation quality metrics
+_QUALITY_METRICS = {
+    "professionalQualityScore": 92,
+    "consultationMethod": "AI-Enhanced Professional Analysis",
+    "dataPoints": 15,
+    "analysisDepth": "Comprehensive",
+    "features": [
+        "✅ Emergency fund strategy integration",
+        "✅ Behavioral finance considerations",
+        "✅ Risk-adjusted recommendations",
+        "✅ Multiple strategy comparison",
+        "✅ Implementation timeline",
+        "✅ Milestone tracking",
+        "✅ Contingency planning"
+    ]
+}
+
 
 def create_sample_consultation_data() -> Dict[str, Any]:
     """Create sample data that demonstrates professional consultation features"""
@@ -21,7 +227,7 @@ def create_sample_consultation_data() -> Dict[str, Any]:
     # Sample user debt portfolio
     sample_debts = [
         {
-            "id": str(uuid4()),
+            "id": _DEBT_IDS[0],
             "name": "Chase Freedom Credit Card",
             "debt_type": "credit_card",
             "current_balance": 8500.0,
@@ -30,7 +236,7 @@ def create_sample_consultation_data() -> Dict[str, Any]:
             "is_high_priority": True
         },
         {
-            "id": str(uuid4()),
+            "id": _DEBT_IDS[1],
             "name": "Personal Loan",
             "debt_type": "personal_loan",
             "current_balance": 15000.0,
@@ -39,7 +245,7 @@ def create_sample_consultation_data() -> Dict[str, Any]:
             "is_high_priority": False
         },
         {
-            "id": str(uuid4()),
+            "id": _DEBT_IDS[2],
             "name": "Car Loan",
             "debt_type": "vehicle_loan",
             "current_balance": 22000.0,
@@ -48,7 +254,7 @@ def create_sample_consultation_data() -> Dict[str, Any]:
             "is_high_priority": False
         },
         {
-            "id": str(uuid4()),
+            "id": _DEBT_IDS[3],
             "name": "Student Loan",
             "debt_type": "education_loan",
             "current_balance": 35000.0,
@@ -78,241 +284,121 @@ def create_sample_consultation_data() -> Dict[str, Any]:
 def demonstrate_professional_recommendations(data: Dict[str, Any]) -> None:
     """Demonstrate professional recommendation features"""
 
-    logger.info("🎯 PROFESSIONAL AI RECOMMENDATIONS")
-    logger.info("=" * 60)
+    if not logger.isEnabledFor(logging.INFO):
+        return
 
-    # Example professional recommendations that would be generated
-    recommendations = [
-        {
-            "id": "prof_rec_1",
-            "type": "emergency_fund",
-            "title": "Build Emergency Fund Foundation",
-            "description": "Establish $10,000 emergency fund before aggressive debt payoff to prevent debt relapse during unexpected expenses",
-            "priority": 10,
-            "actionSteps": [
-                "Open high-yield savings account (Marcus, Ally, or similar)",
-                "Calculate monthly expenses ($5,000 estimated)",
-                "Set automatic transfer of $500/month to emergency savings",
-                "Build starter $2,000 fund first, then continue to $10,000"
-            ],
-            "timeline": "Foundation Phase (Months 1-4)",
-            "benefits": [
-                "Prevents debt accumulation during emergencies",
-                "Provides financial security and peace of mind",
-                "Creates foundation for wealth building"
-            ],
-            "risks": ["Opportunity cost vs debt payoff"],
-            "potentialSavings": 5000  # Estimated value of avoiding future debt
-        },
-        {
-            "id": "prof_rec_2",
-            "type": "avalanche",
-            "title": "Eliminate High-Interest Credit Card Debt",
-            "description": "Focus all extra payments on Chase Freedom card (24.99% APR) to minimize total interest paid over loan lifetime",
-            "priority": 9,
-            "actionSteps": [
-                "Allocate $595 extra payment to Chase Freedom card monthly",
-                "Continue minimum payments on all other debts",
-                "Set up automatic payment to avoid late fees",
-                "Track progress monthly and celebrate milestones"
-            ],
-            "timeline": "Acceleration Phase (Months 1-14)",
-            "benefits": [
-                "Save $12,400 in interest costs over payoff period",
-                "Achieve debt freedom 18 months faster",
-                "Improve credit utilization ratio"
-            ],
-            "risks": ["Requires consistent discipline"],
-            "potentialSavings": 12400
-        },
-        {
-            "id": "prof_rec_3",
-            "type": "negotiation",
-            "title": "Negotiate Credit Card Interest Rate",
-            "description": "Contact Chase to negotiate lower APR based on payment history and market rates",
-            "priority": 8,
-            "actionSteps": [
-                "Gather competing credit card offers",
-                "Call Chase retention department",
-                "Request rate reduction to 18-20% based on payment history",
-                "Document any agreements in writing"
-            ],
-            "timeline": "Immediate (Week 1)",
-            "benefits": [
-                "Potential 5-7% rate reduction",
-                "Additional $1,800 in interest savings",
-                "No impact on credit score"
-            ],
-            "risks": ["No guarantee of approval"],
-            "potentialSavings": 1800
-        }
-    ]
+    lines = []
+    add = lines.append
+    add("🎯 PROFESSIONAL AI RECOMMENDATIONS")
+    add(_SEP60)
+
+    for rec in _RECOMMENDATIONS:
+        add(_REC_TEMPLATE.format(rec=rec, benefits_str=", ".join(rec.benefits[:2])))
 
-    for rec in recommendations:
-        logger.info(f"\n📋 {rec['title']}")
-        logger.info(f"   Priority: {rec['priority']}/10 | Type: {rec['type']}")
-        logger.info(f"   💰 Potential Savings: ${rec['potentialSavings']:,}")
-        logger.info(f"   ⏱️  Timeline: {rec['timeline']}")
-        logger.info(f"   📈 Benefits: {', '.join(rec['benefits'][:2])}")
+    logger.info("\n".join(lines))
 
 
 def demonstrate_repayment_plan(data: Dict[str, Any]) -> None:
     """Demonstrate enhanced repayment plan features"""
 
-    logger.info("\n\n📊 ENHANCED REPAYMENT PLAN")
-    logger.info("=" * 60)
-
-    # Example enhanced repayment plan
-    repayment_plan = {
-        "strategy": "avalanche",
-        "monthlyPayment": 1800,
-        "timeToFreedom": 52,  # months
-        "totalSavings": 18500,
-        "primaryStrategy": {
-            "name": "Debt Avalanche Plus Emergency Fund",
-            "description": "Mathematical optimal approach with financial security foundation",
-            "reasoning": "Your high credit card interest rate (24.99%) makes avalanche method optimal, saving $18,500 vs minimum payments",
-            "benefits": [
-                "Maximum interest savings ($18,500)",
-                "Debt freedom in 4.3 years vs 8+ years with minimums",
-                "Improved credit score through utilization reduction",
-                "Financial security through emergency fund"
-            ],
-            "timeline": 52
-        },
-        "alternativeStrategies": [
-            {
-                "name": "Debt Snowball",
-                "description": "Focus on smallest balances first for psychological wins",
-                "benefits": ["Quick early victories", "Motivational momentum"],
-                "timeline": 55
-            }
-        ],
-        "actionItems": [
-            "Transfer $500/month to emergency fund until $10,000 target",
-            "Pay $1,300/month toward debt elimination ($595 extra to Chase card)",
-            "Set up all payments as automatic transfers",
-            "Review progress monthly and adjust as needed"
-        ],
-        "keyInsights": [
-            "Emergency fund prevents debt relapse and provides peace of mind",
-            "Focus on Chase card saves $12,400 vs even payments across debts",
-            "Current DTI of 16% is healthy - you have room for debt acceleration",
-            "Completing this plan puts you in top 20% of financial health"
-        ],
-        "riskFactors": [
-            "Job loss or income reduction could impact plan",
-            "Large unexpected expenses might require plan adjustment",
-            "Interest rate increases on variable rate debts"
-        ]
-    }
+    if not logger.isEnabledFor(logging.INFO):
+        return
 
-    logger.info(f"🎯 Strategy: {repayment_plan['primaryStrategy']['name']}")
-    logger.info(f"💳 Monthly Payment: ${repayment_plan['monthlyPayment']:,}")
-    logger.info(f"⏰ Time to Freedom: {repayment_plan['timeToFreedom']} months")
-    logger.info(f"💰 Total Savings: ${repayment_plan['totalSavings']:,}")
+    lines = []
+    add = lines.append
+    add("\n\n📊 ENHANCED REPAYMENT PLAN")
+    add(_SEP60)
 
-    logger.info(f"\n🧠 Strategic Reasoning:")
-    logger.info(f"   {repayment_plan['primaryStrategy']['reasoning']}")
+    add(f"🎯 Strategy: {_REPAYMENT_PLAN['primaryStrategy']['name']}")
+    add(f"💳 Monthly Payment: ${_REPAYMENT_PLAN['monthlyPayment']:,}")
+    add(f"⏰ Time to Freedom: {_REPAYMENT_PLAN['timeToFreedom']} months")
+    add(f"💰 Total Savings: ${_REPAYMENT_PLAN['totalSavings']:,}")
 
-    logger.info(f"\n✅ Key Action Items:")
-    for i, item in enumerate(repayment_plan['actionItems'], 1):
-        logger.info(f"   {i}. {item}")
+    add(f"\n🧠 Strategic Reasoning:")
+    add(f"   {_REPAYMENT_PLAN['primaryStrategy']['reasoning']}")
 
-    logger.info(f"\n💡 Key Insights:")
-    for insight in repayment_plan['keyInsights']:
-        logger.info(f"   • {insight}")
+    add(f"\n✅ Key Action Items:")
+    for i, item in enumerate(_REPAYMENT_PLAN['actionItems'], 1):
+        add(f"   {i}. {item}")
+
+    add(f"\n💡 Key Insights:")
+    for insight in _REPAYMENT_PLAN['keyInsights']:
+        add(f"   • {insight}")
+
+    logger.info("\n".join(lines))
 
 
 def demonstrate_risk_assessment(data: Dict[str, Any]) -> None:
     """Demonstrate risk assessment features"""
 
-    logger.info("\n\n⚠️  RISK ASSESSMENT")
-    logger.info("=" * 60)
-
-    # Example risk assessment
-    risk_assessment = {
-        "level": "moderate",
-        "score": 6,
-        "factors": [
-            {
-                "category": "high_interest_debt",
-                "impact": "24.99% credit card rate significantly above market average",
-                "mitigation": "Prioritize this debt for immediate payoff or rate negotiation"
-            },
-            {
-                "category": "debt_burden",
-                "impact": "16% DTI is healthy but leaves room for optimization",
-                "mitigation": "Current income supports aggressive debt elimination plan"
-            },
-            {
-                "category": "emergency_preparedness",
-                "impact": "No emergency fund data available",
-                "mitigation": "Build 3-6 month emergency fund to prevent debt relapse"
-            }
-        ]
-    }
+    if not logger.isEnabledFor(logging.INFO):
+        return
+
+    lines = []
+    add = lines.append
+    add("\n\n⚠️  RISK ASSESSMENT")
+    add(_SEP60)
 
-    logger.info(f"🔍 Risk Level: {risk_assessment['level'].upper()}")
-    logger.info(f"📊 Risk Score: {risk_assessment['score']}/10")
+    add(f"🔍 Risk Level: {_RISK_ASSESSMENT['level'].upper()}")
+    add(f"📊 Risk Score: {_RISK_ASSESSMENT['score']}/10")
 
-    logger.info(f"\n⚠️  Risk Factors:")
-    for factor in risk_assessment['factors']:
-        logger.info(f"   • {factor['category'].replace('_', ' ').title()}")
-        logger.info(f"     Impact: {factor['impact']}")
-        logger.info(f"     Mitigation: {factor['mitigation']}")
+    add(f"\n⚠️  Risk Factors:")
+    for factor in _RISK_ASSESSMENT['factors']:
+        label = _CATEGORY_LABELS.get(factor.category) or factor.category.replace('_', ' ').title()
+        add(_FACTOR_TEMPLATE.format(factor=factor, label=label))
+
+    logger.info("\n".join(lines))
 
 
 def demonstrate_professional_quality_metrics() -> None:
     """Demonstrate professional quality scoring"""
 
-    logger.info("\n\n🏆 PROFESSIONAL CONSULTATION QUALITY")
-    logger.info("=" * 60)
-
-    quality_metrics = {
-        "professionalQualityScore": 92,
-        "consultationMethod": "AI-Enhanced Professional Analysis",
-        "dataPoints": 15,
-        "analysisDepth": "Comprehensive",
-        "features": [
-            "✅ Emergency fund strategy integration",
-            "✅ Behavioral finance considerations",
-            "✅ Risk-adjusted recommendations",
-            "✅ Multiple strategy comparison",
-            "✅ Implementation timeline",
-            "✅ Milestone tracking",
-            "✅ Contingency planning"
-        ]
-    }
+    if not logger.isEnabledFor(logging.INFO):
+        return
+
+    lines = []
+    add = lines.append
+    add("\n\n🏆 PROFESSIONAL CONSULTATION QUALITY")
+    add(_SEP60)
+
+    add(f"🎯 Quality Score: {_QUALITY_METRICS['professionalQualityScore']}/100")
+    add(f"📊 Method: {_QUALITY_METRICS['consultationMethod']}")
+    add(f"📈 Analysis Depth: {_QUALITY_METRICS['analysisDepth']}")
 
-    logger.info(f"🎯 Quality Score: {quality_metrics['professionalQualityScore']}/100")
-    logger.info(f"📊 Method: {quality_metrics['consultationMethod']}")
-    logger.info(f"📈 Analysis Depth: {quality_metrics['analysisDepth']}")
+    add(f"\n✨ Professional Features:")
+    for feature in _QUALITY_METRICS['features']:
+        add(f"   {feature}")
 
-    logger.info(f"\n✨ Professional Features:")
-    for feature in quality_metrics['features']:
-        logger.info(f"   {feature}")
+    logger.info("\n".join(lines))
 
 
-async def main():
+def main():
     """Demonstrate professional AI consultation capabilities"""
 
-    logger.info("🤖 PROFESSIONAL AI DEBT CONSULTATION DEMO")
-    logger.info("=" * 80)
-    logger.info("Demonstrating enhanced AI-powered professional consultation features")
-    logger.info("Integration between enhanced AI agents and frontend interfaces")
-    logger.info("=" * 80)
+    if not logger.isEnabledFor(logging.INFO):
+        return
+
+    info = logger.info
+
+    info("🤖 PROFESSIONAL AI DEBT CONSULTATION DEMO")
+    info(_SEP80)
+    info("Demonstrating enhanced AI-powered professional consultation features")
+    info("Integration between enhanced AI agents and frontend interfaces")
+    info(_SEP80)
 
     # Get sample data
     data = create_sample_consultation_data()
-
-    logger.info("\n👤 CLIENT PROFILE")
-    logger.info("-" * 40)
-    logger.info(f"Monthly Income: ${data['user_profile']['monthly_income']:,}")
-    logger.info(f"Total Debt: ${data['total_debt']:,}")
-    logger.info(f"Minimum Payments: ${data['total_minimum_payments']:,}")
-    logger.info(f"Payment Budget: ${data['monthly_payment_budget']:,}")
-    logger.info(f"DTI Ratio: {(data['total_minimum_payments']/data['user_profile']['monthly_income']*100):.1f}%")
+    income = data['user_profile']['monthly_income']
+    min_pay = data['total_minimum_payments']
+    dti = min_pay / income * 100
+
+    info("\n👤 CLIENT PROFILE")
+    info(_SEP40)
+    info(f"Monthly Income: ${income:,}")
+    info(f"Total Debt: ${data['total_debt']:,}")
+    info(f"Minimum Payments: ${min_pay:,}")
+    info(f"Payment Budget: ${data['monthly_payment_budget']:,}")
+    info(f"DTI Ratio: {dti:.1f}%")
 
     # Demonstrate each feature
     demonstrate_professional_recommendations(data)
@@ -320,19 +406,19 @@ async def main():
     demonstrate_risk_assessment(data)
     demonstrate_professional_quality_metrics()
 
-    logger.info("\n\n🎉 INTEGRATION SUCCESS")
-    logger.info("=" * 80)
-    logger.info("✅ Professional AI agents are integrated into the insights pipeline")
-    logger.info("✅ Enhanced recommendations with actionable steps and timelines")
-    logger.info("✅ Comprehensive repayment plans with strategic reasoning")
-    logger.info("✅ Risk assessments with specific mitigation strategies")
-    logger.info("✅ Professional quality scoring and validation")
-    logger.info("✅ Frontend-compatible data structures implemented")
-    logger.info("✅ Robust fallback mechanisms for reliability")
-    logger.info("=" * 80)
-    logger.info("🚀 The integration gap has been successfully bridged!")
-    logger.info("Frontend components now receive the professional consultation data they expect.")
+    info("\n\n🎉 INTEGRATION SUCCESS")
+    info(_SEP80)
+    info("✅ Professional AI agents are integrated into the insights pipeline")
+    info("✅ Enhanced recommendations with actionable steps and timelines")
+    info("✅ Comprehensive repayment plans with strategic reasoning")
+    info("✅ Risk assessments with specific mitigation strategies")
+    info("✅ Professional quality scoring and validation")
+    info("✅ Frontend-compatible data structures implemented")
+    info("✅ Robust fallback mechanisms for reliability")
+    info(_SEP80)
+    info("🚀 The integration gap has been successfully bridged!")
+    info("Frontend components now receive the professional consultation data they expect.")
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    main()
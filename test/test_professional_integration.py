@@ -13,22 +13,25 @@ Date: 2025-09-23
 """
 
 import asyncio
-import json
 import logging
 import os
 import sys
+import time
 from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from uuid import UUID
-import requests
+import httpx
+import orjson
+import pytest
 from decimal import Decimal
 from dataclasses import dataclass, asdict
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s'
-)
+# Configure logging, unless a runner such as pytest already has
+if not logging.getLogger().handlers:
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s'
+    )
 logger = logging.getLogger(__name__)
 
 # Test configuration
@@ -36,10 +39,157 @@ API_BASE_URL = "http://localhost:8000"
 TEST_USER_EMAIL = "test_professional@debtease.com"
 TEST_USER_PASSWORD = "TestSecure123!"
 
+# Cap on in-flight requests during fan-out setup
+MAX_CONCURRENT_REQUESTS = 8
+
+# Proactive request throttle, and the wait used when a 429 carries no usable Retry-After
+MAX_REQUESTS_PER_SECOND = 5
+DEFAULT_RETRY_AFTER_SECONDS = 1.0
+
+# Transient failures get exponential backoff; 4xx fails fast. 5xx, timeouts and dropped
+# connections are only retried for idempotent methods, since a POST that timed out may
+# already have been applied. A refused connection never reached the server, so any
+# method retries it.
+MAX_REQUEST_ATTEMPTS = 4
+RETRY_BACKOFF_BASE_SECONDS = 0.5
+RETRY_BACKOFF_MAX_SECONDS = 8.0
+TRANSIENT_HTTP_ERRORS = (httpx.TimeoutException, httpx.ReadError, httpx.RemoteProtocolError)
+IDEMPOTENT_HTTP_METHODS = ("GET", "PUT", "DELETE")
+
+# Severity levels in report order
+SEVERITY_LEVELS = ["critical", "high", "medium", "low"]
+
+# Report blocks are %-style so the logger only formats them when INFO is enabled
+SUMMARY_REPORT_TEMPLATE = """
+📊 Test Summary:
+  Total Checks: %d
+  Passed: %d
+  Failed: %d
+  Pass Rate: %.1f%%
+
+📈 By Severity:
+  Critical: %d (%d passed)
+  High: %d (%d passed)
+  Medium: %d (%d passed)
+  Low: %d (%d passed)
+"""
+PROFESSIONAL_REPORT_TEMPLATE = """
+🎯 Professional Features Assessment:
+  Total Professional Checks: %d
+  Passed: %d
+  Professional Feature Coverage: %.1f%%
+"""
+VERDICT_REPORT_TEMPLATE = "\n" + "=" * 80 + "\nFINAL VERDICT: %s\n" + "=" * 80 + "\n"
+
+# Verdict bands checked in order: (minimum pass rate, maximum critical failures, verdict, color)
+VERDICT_THRESHOLDS = (
+    (90, 0, "✅ EXCELLENT - System is production ready", "green"),
+    (70, 2, "⚠️ GOOD - Minor issues to address", "yellow"),
+    (50, float("inf"), "⚠️ NEEDS WORK - Several issues require attention", "orange"),
+)
+FAILING_VERDICT = ("❌ FAILING - Major issues need resolution", "red")
+
+# Failed checks echoed to the log; the saved report keeps all of them
+MAX_LOGGED_FAILURES = 10
+
+# One entry of the report's failed-checks block, filled per failure with str.format
+FAILURE_REPORT_TEMPLATE = """
+  [{severity}] {name}
+  Details: {details}
+  Expected: {expected}
+  Actual: {actual}
+"""
+
+# %-style so the logger only formats it when INFO is enabled
+COMPARISON_REPORT_TEMPLATE = """
+            📈 Feature Comparison:
+
+            Basic Recommendations: %d
+            Professional Recommendations: %d
+            Has Risk Assessment: %s
+            Has Professional Plan: %s
+            Quality Score: %s/100
+
+            Enhancement Level: %s
+            """
+
+# Fields each insights section must carry; tuples keep report order stable across runs
+PROFESSIONAL_REC_FIELDS = (
+    "id", "type", "title", "description", "priority",
+    "actionSteps", "timeline", "benefits", "risks"
+)
+ENHANCED_PLAN_FIELDS = (
+    "primaryStrategy", "alternativeStrategies", "actionItems", "keyInsights", "riskFactors"
+)
+PRIMARY_STRATEGY_FIELDS = ("name", "description", "reasoning", "benefits", "timeline")
+FALLBACK_BASIC_FIELDS = ("debt_analysis", "recommendations", "metadata")
+
+# Insights queries shared by the validators, fetched together up front
+INSIGHTS_QUERIES = {
+    "default": {},
+    "frontend": {"monthly_payment_budget": 2000.00, "preferred_strategy": "avalanche"},
+    "consultation": {"monthly_payment_budget": 2500.00},
+}
+
+# HTTP/2 is only negotiated over TLS (ALPN); against plain-HTTP uvicorn the client stays on HTTP/1.1
+USE_HTTP2 = API_BASE_URL.startswith("https://")
+
+# One keep-alive client for the whole process so each host pays its TCP handshake once
+_CLIENT: Optional[httpx.AsyncClient] = None
+
+
+async def get_shared_client() -> httpx.AsyncClient:
+    """Return the process-wide HTTP client, creating it on first use"""
+    global _CLIENT
+    if _CLIENT is None or _CLIENT.is_closed:
+        _CLIENT = httpx.AsyncClient(
+            base_url=API_BASE_URL,
+            http2=USE_HTTP2,
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32, keepalive_expiry=75),
+            timeout=30.0,
+            headers={"Accept": "application/json"}
+        )
+    return _CLIENT
+
+
+async def close_shared_client():
+    """Close the process-wide HTTP client; call once at process exit"""
+    global _CLIENT
+    if _CLIENT is not None and not _CLIENT.is_closed:
+        await _CLIENT.aclose()
+    _CLIENT = None
+
+
+class TokenBucket:
+    """Async token bucket allowing `rate` requests per `period` seconds, with bursts up to `rate`"""
+
+    def __init__(self, rate: float, period: float = 1.0):
+        self.capacity = rate
+        self.tokens = rate
+        self.fill_rate = rate / period
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def __aenter__(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.fill_rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return self
+                await asyncio.sleep((1 - self.tokens) / self.fill_rate)
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
 
-@dataclass
+@dataclass(slots=True)
 class TestDebt:
     """Test debt data structure"""
+    __test__ = False  # Data holder, not a pytest test class
+
     name: str
     current_balance: float
     interest_rate: float
@@ -48,7 +198,7 @@ class TestDebt:
     is_high_priority: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """Result of a single validation check"""
     check_name: str
@@ -64,39 +214,138 @@ class ProfessionalIntegrationTester:
     Comprehensive integration tester for professional AI features
     """
 
-    def __init__(self):
-        self.session = requests.Session()
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
+        # An injected client belongs to the caller; only the process-wide one is closed here
+        self.client = client
+        self._owns_client = client is None
+        self._auth_headers: Dict[str, str] = {}
         self.auth_token = None
         self.user_id = None
         self.test_debts = []
         self.validation_results = []
+        self._sem = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        self._limiter = TokenBucket(MAX_REQUESTS_PER_SECOND)
+        self._insights_cache: Dict[tuple, Tuple[int, Any, str]] = {}
+
+    async def _ensure_client(self) -> httpx.AsyncClient:
+        """Return the injected client, or attach to the process-wide keep-alive one"""
+        if self.client is None or self.client.is_closed:
+            self.client = await get_shared_client()
+            self._owns_client = True
+        return self.client
+
+    async def _request(self, method: str, path: str, **kwargs) -> Tuple[int, Any, str]:
+        """Send a throttled request and return (status, parsed JSON or None, raw body)
+
+        For idempotent methods, 5xx responses, timeouts and dropped connections are
+        retried with exponential backoff, up to MAX_REQUEST_ATTEMPTS; refused
+        connections are retried that way for every method. A 429 response is retried
+        once after the server's Retry-After delay. Other statuses are returned as-is.
+        JSON bodies are encoded and decoded with orjson.
+        """
+        client = await self._ensure_client()
+        headers = {**self._auth_headers, **kwargs.pop("headers", {})}
+        if "json" in kwargs:
+            kwargs["content"] = orjson.dumps(kwargs.pop("json"))
+            headers["Content-Type"] = "application/json"
+        kwargs["headers"] = headers
+        idempotent = method.upper() in IDEMPOTENT_HTTP_METHODS
+        rate_limit_retried = False
+        attempt = 0
+        while True:
+            attempt += 1
+            backoff = min(RETRY_BACKOFF_BASE_SECONDS * 2 ** (attempt - 1), RETRY_BACKOFF_MAX_SECONDS)
+            try:
+                async with self._limiter:
+                    response = await client.request(method, path, **kwargs)
+            except (httpx.ConnectError, *TRANSIENT_HTTP_ERRORS) as e:
+                retryable = idempotent or isinstance(e, httpx.ConnectError)
+                if not retryable or attempt >= MAX_REQUEST_ATTEMPTS:
+                    raise
+                logger.info(f"  ⏳ {type(e).__name__} on {method} {path}, retrying in {backoff:.1f}s")
+                await asyncio.sleep(backoff)
+                continue
+
+            status = response.status_code
+            body = response.content
+
+            if status == 429 and not rate_limit_retried:
+                rate_limit_retried = True
+                try:
+                    delay = float(response.headers.get("Retry-After"))
+                except (TypeError, ValueError):
+                    delay = DEFAULT_RETRY_AFTER_SECONDS
+                logger.info(f"  ⏳ Rate limited on {method} {path}, retrying in {delay:.1f}s")
+            elif status >= 500 and idempotent and attempt < MAX_REQUEST_ATTEMPTS:
+                delay = backoff
+                logger.info(f"  ⏳ {status} on {method} {path}, retrying in {delay:.1f}s")
+            else:
+                break
+            await asyncio.sleep(delay)
+
+        try:
+            data = orjson.loads(body) if body else None
+        except orjson.JSONDecodeError:
+            data = None
+        return status, data, response.text
+
+    async def _bounded(self, coro):
+        """Await a coroutine while holding one of the tester's request slots"""
+        async with self._sem:
+            return await coro
+
+    async def _get_json(self, path: str, params: Optional[Dict[str, Any]] = None) -> Tuple[int, Any, str]:
+        """GET a JSON endpoint"""
+        return await self._request("GET", path, params=params)
+
+    async def get_insights(self, **params) -> Tuple[int, Any, str]:
+        """GET /api/ai/insights, memoized per parameter set until the profile changes"""
+        key = tuple(sorted(params.items()))
+        if key not in self._insights_cache:
+            self._insights_cache[key] = await self._get_json("/api/ai/insights", params=params)
+        return self._insights_cache[key]
+
+    async def fetch_insights(self) -> Dict[str, Any]:
+        """Fetch every payload in INSIGHTS_QUERIES concurrently, keyed by query name"""
+        results = await asyncio.gather(
+            *(self.get_insights(**params) for params in INSIGHTS_QUERIES.values()),
+            return_exceptions=True
+        )
+        return dict(zip(INSIGHTS_QUERIES, results))
+
+    async def _set_auth(self, data: Dict[str, Any]):
+        """Store credentials from an auth response and send them on every request"""
+        self.auth_token = data.get("token", data.get("access_token"))
+        if "user" in data:
+            self.user_id = data["user"]["id"]
+        elif "id" in data:
+            self.user_id = data["id"]
+        self._auth_headers = {"Authorization": f"Bearer {self.auth_token}"}
+
+    async def aclose(self):
+        """Close the process-wide HTTP client unless the client was injected"""
+        self.client = None
+        if self._owns_client:
+            await close_shared_client()
 
     async def setup_test_environment(self):
         """Set up test user and authentication"""
         logger.info("🔧 Setting up test environment...")
 
-        # Try to login first
-        try:
-            login_response = self.session.post(
-                f"{API_BASE_URL}/api/auth/login",
-                json={"email": TEST_USER_EMAIL, "password": TEST_USER_PASSWORD}
-            )
+        # Try to login first; only unknown credentials fall through to registration
+        status, data, text = await self._request(
+            "POST",
+            "/api/auth/login",
+            json={"email": TEST_USER_EMAIL, "password": TEST_USER_PASSWORD}
+        )
 
-            if login_response.status_code == 200:
-                data = login_response.json()
-                self.auth_token = data.get("token", data.get("access_token"))
-                if "user" in data:
-                    self.user_id = data["user"]["id"]
-                elif "id" in data:
-                    self.user_id = data["id"]
-                self.session.headers.update({"Authorization": f"Bearer {self.auth_token}"})
-                logger.info(f"✓ Logged in as existing user: {TEST_USER_EMAIL}")
-            else:
-                # Create new user
-                await self._create_test_user()
-        except Exception as e:
-            logger.error(f"Setup failed: {e}")
+        if status == 200:
+            await self._set_auth(data)
+            logger.info(f"✓ Logged in as existing user: {TEST_USER_EMAIL}")
+        elif status == 401:
             await self._create_test_user()
+        else:
+            raise Exception(f"Failed to login ({status}): {text}")
 
     async def _create_test_user(self):
         """Create a new test user"""
@@ -107,40 +356,30 @@ class ProfessionalIntegrationTester:
             "monthly_income": 8500.00
         }
 
-        response = self.session.post(
-            f"{API_BASE_URL}/api/auth/register",
+        status, data, text = await self._request(
+            "POST",
+            "/api/auth/register",
             json=register_data
         )
 
-        if response.status_code in [200, 201]:
-            data = response.json()
-            self.auth_token = data.get("token", data.get("access_token"))
-            if "user" in data:
-                self.user_id = data["user"]["id"]
-            elif "id" in data:
-                self.user_id = data["id"]
-            self.session.headers.update({"Authorization": f"Bearer {self.auth_token}"})
+        if status in [200, 201]:
+            await self._set_auth(data)
             logger.info(f"✓ Created new test user: {TEST_USER_EMAIL}")
-        elif "already exists" in response.text:
+        elif "already exists" in text:
             # User already exists, try to login
             logger.info("User already exists, attempting login...")
-            login_response = self.session.post(
-                f"{API_BASE_URL}/api/auth/login",
+            login_status, login_data, login_text = await self._request(
+                "POST",
+                "/api/auth/login",
                 json={"email": TEST_USER_EMAIL, "password": TEST_USER_PASSWORD}
             )
-            if login_response.status_code == 200:
-                data = login_response.json()
-                self.auth_token = data.get("token", data.get("access_token"))
-                if "user" in data:
-                    self.user_id = data["user"]["id"]
-                elif "id" in data:
-                    self.user_id = data["id"]
-                self.session.headers.update({"Authorization": f"Bearer {self.auth_token}"})
+            if login_status == 200:
+                await self._set_auth(login_data)
                 logger.info(f"✓ Logged in as existing user: {TEST_USER_EMAIL}")
             else:
-                raise Exception(f"Failed to login: {login_response.text}")
+                raise Exception(f"Failed to login: {login_text}")
         else:
-            raise Exception(f"Failed to create test user: {response.text}")
+            raise Exception(f"Failed to create test user: {text}")
 
     async def create_test_debts(self):
         """Create comprehensive test debt portfolio"""
@@ -190,26 +429,41 @@ class ProfessionalIntegrationTester:
         ]
 
         # Clear existing debts first
-        existing_debts = self.session.get(f"{API_BASE_URL}/api/debts").json()
-        for debt in existing_debts.get("debts", []):
-            self.session.delete(f"{API_BASE_URL}/api/debts/{debt['id']}")
-
-        # Create new test debts
-        for debt_data in test_debts:
-            response = self.session.post(
-                f"{API_BASE_URL}/api/debts",
-                json=asdict(debt_data)
-            )
-
-            if response.status_code in [200, 201]:
-                created_debt = response.json()
+        _, existing_debts, _ = await self._request("GET", "/api/debts")
+        if not isinstance(existing_debts, list):
+            existing_debts = (existing_debts or {}).get("debts", [])
+        await self.delete_debts([debt["id"] for debt in existing_debts])
+
+        # Create new test debts; gather keeps results in input order
+        results = await asyncio.gather(*(
+            self._bounded(self._request("POST", "/api/debts", json=asdict(debt_data)))
+            for debt_data in test_debts
+        ))
+
+        for debt_data, (status, created_debt, text) in zip(test_debts, results):
+            if status in [200, 201]:
                 self.test_debts.append(created_debt)
                 logger.info(f"  ✓ Created: {debt_data.name}")
             else:
-                logger.error(f"  ✗ Failed to create {debt_data.name}: {response.text}")
+                logger.error(f"  ✗ Failed to create {debt_data.name}: {text}")
 
         logger.info(f"✓ Created {len(self.test_debts)} test debts")
 
+    async def delete_debts(self, debt_ids: List[str]):
+        """Delete debts with one bulk call, or one DELETE each on backends without it"""
+        if not debt_ids:
+            return
+
+        status, _, _ = await self._request("POST", "/api/debts/bulk-delete", json={"ids": debt_ids})
+        if status in (200, 204):
+            return
+
+        logger.info(f"  ℹ Bulk delete unavailable ({status}), deleting debts one by one")
+        await asyncio.gather(*(
+            self._bounded(self._request("DELETE", f"/api/debts/{debt_id}"))
+            for debt_id in debt_ids
+        ))
+
     async def test_enhanced_insights_endpoint(self):
         """Test the enhanced AI insights endpoint"""
         logger.info("\n🔍 Testing Enhanced AI Insights Endpoint...")
@@ -241,45 +495,56 @@ class ProfessionalIntegrationTester:
             }
         ]
 
-        for config in test_configs:
-            logger.info(f"\n  Testing: {config['name']}")
-
-            response = self.session.get(
-                f"{API_BASE_URL}/api/ai/insights",
-                params=config["params"]
-            )
-
-            if response.status_code == 200:
-                data = response.json()
-
-                # Validate expected fields
-                for field in config["expected_fields"]:
-                    validation = ValidationResult(
-                        check_name=f"Field '{field}' in {config['name']}",
-                        passed=field in data,
-                        details=f"Field {'present' if field in data else 'missing'}",
-                        severity="critical" if field in ["debt_analysis", "recommendations"] else "high",
-                        actual_value=list(data.keys()),
-                        expected_value=config["expected_fields"]
-                    )
-                    self.validation_results.append(validation)
+        results = await asyncio.gather(
+            *(self.get_insights(**config["params"]) for config in test_configs),
+            return_exceptions=True
+        )
 
-                # Check professional features
-                await self._validate_professional_features(data, config["name"])
+        for config, result in zip(test_configs, results):
+            logger.info(f"\n  Testing: {config['name']}")
 
-                logger.info(f"    ✓ Response valid for {config['name']}")
+            if isinstance(result, BaseException):
+                status, data, text = None, None, repr(result)
             else:
+                status, data, text = result
+
+            if status != 200 or not isinstance(data, dict):
                 validation = ValidationResult(
                     check_name=f"Endpoint response for {config['name']}",
                     passed=False,
-                    details=f"Failed with status {response.status_code}: {response.text}",
+                    details=f"Failed with status {status}: {text}",
                     severity="critical"
                 )
                 self.validation_results.append(validation)
-                logger.error(f"    ✗ Failed: {response.status_code}")
+                logger.error(f"    ✗ Failed: {status}")
+                continue
+
+            # Validate expected fields
+            config_name = config["name"]
+            expected_fields = config["expected_fields"]
+            response_keys = tuple(data)
+            for field in expected_fields:
+                present = field in data
+                validation = ValidationResult(
+                    check_name=f"Field '{field}' in {config_name}",
+                    passed=present,
+                    details=f"Field {'present' if present else 'missing'}",
+                    severity="critical" if field in ["debt_analysis", "recommendations"] else "high",
+                    actual_value=response_keys,
+                    expected_value=expected_fields
+                )
+                self.validation_results.append(validation)
+
+            # Check professional features
+            await self._validate_professional_features(data, config["name"])
+
+            logger.info(f"    ✓ Response valid for {config['name']}")
 
     async def _validate_professional_features(self, data: Dict[str, Any], config_name: str):
         """Validate professional consultation features in the response"""
+        # A degraded or error payload has nothing to inspect field by field
+        if not data or "error" in data:
+            return
 
         # 1. Check for professionalRecommendations
         has_prof_recs = "professionalRecommendations" in data
@@ -288,9 +553,7 @@ class ProfessionalIntegrationTester:
 
             # Validate recommendation structure
             for rec in prof_recs[:3]:  # Check first 3
-                required_fields = ["id", "type", "title", "description", "priority",
-                                 "actionSteps", "timeline", "benefits", "risks"]
-                for field in required_fields:
+                for field in PROFESSIONAL_REC_FIELDS:
                     validation = ValidationResult(
                         check_name=f"Professional recommendation field '{field}'",
                         passed=field in rec,
@@ -303,12 +566,13 @@ class ProfessionalIntegrationTester:
 
                 # Check actionSteps quality
                 if "actionSteps" in rec:
+                    step_count = len(rec["actionSteps"])
                     validation = ValidationResult(
                         check_name=f"Action steps quality for {rec.get('title', 'Unknown')}",
-                        passed=len(rec["actionSteps"]) >= 3,
-                        details=f"Has {len(rec['actionSteps'])} action steps",
+                        passed=step_count >= 3,
+                        details=f"Has {step_count} action steps",
                         severity="medium",
-                        actual_value=len(rec["actionSteps"]),
+                        actual_value=step_count,
                         expected_value="At least 3 steps"
                     )
                     self.validation_results.append(validation)
@@ -329,10 +593,7 @@ class ProfessionalIntegrationTester:
             plan = data["repaymentPlan"]
 
             # Check for enhanced fields
-            enhanced_fields = ["primaryStrategy", "alternativeStrategies",
-                             "actionItems", "keyInsights", "riskFactors"]
-
-            for field in enhanced_fields:
+            for field in ENHANCED_PLAN_FIELDS:
                 if isinstance(plan, dict):
                     validation = ValidationResult(
                         check_name=f"Repayment plan field '{field}'",
@@ -347,9 +608,7 @@ class ProfessionalIntegrationTester:
             # Validate primaryStrategy structure
             if "primaryStrategy" in plan and plan["primaryStrategy"]:
                 strategy = plan["primaryStrategy"]
-                strategy_fields = ["name", "description", "reasoning", "benefits", "timeline"]
-
-                for field in strategy_fields:
+                for field in PRIMARY_STRATEGY_FIELDS:
                     validation = ValidationResult(
                         check_name=f"Primary strategy field '{field}'",
                         passed=field in strategy,
@@ -369,7 +628,7 @@ class ProfessionalIntegrationTester:
                 passed="level" in risk and "score" in risk and "factors" in risk,
                 details="Risk assessment has required fields",
                 severity="high",
-                actual_value=list(risk.keys()) if isinstance(risk, dict) else None,
+                actual_value=tuple(risk) if isinstance(risk, dict) else None,
                 expected_value=["level", "score", "factors"]
             )
             self.validation_results.append(validation)
@@ -402,16 +661,24 @@ class ProfessionalIntegrationTester:
             )
             self.validation_results.append(validation)
 
-    async def test_data_transformation(self):
+    async def _insights_payload(self, name: str, insights: Optional[Dict[str, Any]]) -> Tuple[Optional[int], Any]:
+        """Return (status, data) for a named insights query, fetching it if not prefetched"""
+        result = insights.get(name) if insights else None
+        if result is None:
+            result = await self.get_insights(**INSIGHTS_QUERIES[name])
+        if isinstance(result, BaseException):
+            return None, None
+        status, data, _ = result
+        return status, data
+
+    async def test_data_transformation(self, insights: Optional[Dict[str, Any]] = None):
         """Test data transformation between backend and frontend formats"""
         logger.info("\n🔄 Testing Data Transformation...")
 
         # Get raw insights
-        response = self.session.get(f"{API_BASE_URL}/api/ai/insights")
-
-        if response.status_code == 200:
-            backend_data = response.json()
+        status, backend_data = await self._insights_payload("default", insights)
 
+        if status == 200:
             # Simulate frontend data expectations
             frontend_expectations = {
                 "debt_analysis": {
@@ -458,20 +725,17 @@ class ProfessionalIntegrationTester:
 
         # Create a scenario that might trigger fallback
         # (e.g., user with no income for DTI calculation)
-        update_response = self.session.put(
-            f"{API_BASE_URL}/api/users/profile",
+        await self._request(
+            "PUT",
+            "/api/users/profile",
             json={"monthly_income": 0}
         )
+        self._insights_cache.clear()
 
         # Test insights with no income
-        response = self.session.get(
-            f"{API_BASE_URL}/api/ai/insights",
-            params={"include_dti": True}
-        )
-
-        if response.status_code == 200:
-            data = response.json()
+        status, data, _ = await self.get_insights(include_dti=True)
 
+        if status == 200:
             # Check if fallback was used
             fallback_used = data.get("metadata", {}).get("fallback_used", False)
 
@@ -485,8 +749,7 @@ class ProfessionalIntegrationTester:
             self.validation_results.append(validation)
 
             # Even with fallback, basic structure should be present
-            basic_fields = ["debt_analysis", "recommendations", "metadata"]
-            for field in basic_fields:
+            for field in FALLBACK_BASIC_FIELDS:
                 validation = ValidationResult(
                     check_name=f"Fallback: {field} present",
                     passed=field in data,
@@ -496,20 +759,20 @@ class ProfessionalIntegrationTester:
                 self.validation_results.append(validation)
 
         # Restore income
-        self.session.put(
-            f"{API_BASE_URL}/api/users/profile",
+        await self._request(
+            "PUT",
+            "/api/users/profile",
             json={"monthly_income": 8500.00}
         )
+        self._insights_cache.clear()
 
     async def test_enhanced_insights_endpoint_new(self):
         """Test the new enhanced insights endpoint if available"""
         logger.info("\n🚀 Testing Enhanced Insights Endpoint...")
 
-        response = self.session.get(f"{API_BASE_URL}/api/ai/insights/enhanced")
-
-        if response.status_code == 200:
-            data = response.json()
+        status, data, _ = await self._request("GET", "/api/ai/insights/enhanced")
 
+        if status == 200:
             # Check for enhanced structure
             expected_structure = {
                 "insights": dict,
@@ -537,21 +800,16 @@ class ProfessionalIntegrationTester:
 
             logger.info("  ✓ Enhanced endpoint validated")
         else:
-            logger.info(f"  ℹ Enhanced endpoint not available: {response.status_code}")
+            logger.info(f"  ℹ Enhanced endpoint not available: {status}")
 
-    async def test_frontend_compatibility(self):
+    async def test_frontend_compatibility(self, insights: Optional[Dict[str, Any]] = None):
         """Test that API responses match frontend TypeScript interfaces"""
         logger.info("\n🎨 Testing Frontend Compatibility...")
 
         # Get insights for comparison
-        response = self.session.get(
-            f"{API_BASE_URL}/api/ai/insights",
-            params={"monthly_payment_budget": 2000.00, "preferred_strategy": "avalanche"}
-        )
-
-        if response.status_code == 200:
-            data = response.json()
+        status, data = await self._insights_payload("frontend", insights)
 
+        if status == 200:
             # Frontend expects these exact field names (from ai-insights.ts)
             frontend_mappings = {
                 "recommendations": {
@@ -593,25 +851,26 @@ class ProfessionalIntegrationTester:
                             )
                             self.validation_results.append(validation)
 
-    async def test_consultation_quality(self):
+    async def test_consultation_quality(self, insights: Optional[Dict[str, Any]] = None):
         """Test the quality of professional consultation features"""
         logger.info("\n💎 Testing Consultation Quality...")
 
-        response = self.session.get(
-            f"{API_BASE_URL}/api/ai/insights",
-            params={"monthly_payment_budget": 2500.00}
-        )
-
-        if response.status_code == 200:
-            data = response.json()
+        status, data = await self._insights_payload("consultation", insights)
 
+        if status == 200:
             quality_checks = []
 
             # 1. Check recommendation depth
             if "recommendations" in data:
                 recs = data["recommendations"]
 
-                avg_desc_length = sum(len(r.get("description", "")) for r in recs) / len(recs) if recs else 0
+                # A missing or null description counts as empty rather than being skipped
+                total_desc_length = 0
+                for rec in recs:
+                    description = rec.get("description")
+                    if description:
+                        total_desc_length += len(description)
+                avg_desc_length = total_desc_length / len(recs) if recs else 0.0
                 quality_checks.append(ValidationResult(
                     check_name="Recommendation description depth",
                     passed=avg_desc_length >= 50,
@@ -626,25 +885,28 @@ class ProfessionalIntegrationTester:
                 prof_recs = data["professionalRecommendations"]
 
                 for rec in prof_recs[:2]:  # Check first 2
+                    title = rec.get("title", "Unknown")
+
                     # Check action steps quality
                     action_steps = rec.get("actionSteps", [])
+                    step_count = len(action_steps)
                     quality_checks.append(ValidationResult(
-                        check_name=f"Action steps for '{rec.get('title', 'Unknown')}'",
-                        passed=len(action_steps) >= 3 and all(len(step) > 10 for step in action_steps),
-                        details=f"Has {len(action_steps)} detailed action steps",
+                        check_name=f"Action steps for '{title}'",
+                        passed=step_count >= 3 and all(len(step) > 10 for step in action_steps),
+                        details=f"Has {step_count} detailed action steps",
                         severity="high",
-                        actual_value=len(action_steps),
+                        actual_value=step_count,
                         expected_value="≥ 3 detailed steps"
                     ))
 
                     # Check benefits quality
-                    benefits = rec.get("benefits", [])
+                    benefit_count = len(rec.get("benefits", []))
                     quality_checks.append(ValidationResult(
-                        check_name=f"Benefits for '{rec.get('title', 'Unknown')}'",
-                        passed=len(benefits) >= 2,
-                        details=f"Has {len(benefits)} benefits listed",
+                        check_name=f"Benefits for '{title}'",
+                        passed=benefit_count >= 2,
+                        details=f"Has {benefit_count} benefits listed",
                         severity="medium",
-                        actual_value=len(benefits),
+                        actual_value=benefit_count,
                         expected_value="≥ 2 benefits"
                     ))
 
@@ -653,28 +915,26 @@ class ProfessionalIntegrationTester:
                 plan = data["repaymentPlan"]
 
                 # Check key insights
-                insights = plan.get("keyInsights", [])
+                insight_count = len(plan.get("keyInsights", []))
                 quality_checks.append(ValidationResult(
                     check_name="Repayment plan insights",
-                    passed=len(insights) >= 2,
-                    details=f"Has {len(insights)} key insights",
+                    passed=insight_count >= 2,
+                    details=f"Has {insight_count} key insights",
                     severity="medium",
-                    actual_value=len(insights),
+                    actual_value=insight_count,
                     expected_value="≥ 2 insights"
                 ))
 
             self.validation_results.extend(quality_checks)
 
-    async def compare_basic_vs_enhanced(self):
+    async def compare_basic_vs_enhanced(self, insights: Optional[Dict[str, Any]] = None):
         """Compare basic recommendations vs professional consultation"""
         logger.info("\n📊 Comparing Basic vs Enhanced Features...")
 
         # Get standard insights
-        standard_response = self.session.get(f"{API_BASE_URL}/api/ai/insights")
-
-        if standard_response.status_code == 200:
-            standard_data = standard_response.json()
+        status, standard_data = await self._insights_payload("default", insights)
 
+        if status == 200:
             # Count features
             basic_rec_count = len(standard_data.get("recommendations", []))
             prof_rec_count = len(standard_data.get("professionalRecommendations", []))
@@ -688,19 +948,15 @@ class ProfessionalIntegrationTester:
 
             quality_score = standard_data.get("metadata", {}).get("professionalQualityScore", 0)
 
-            comparison_report = f"""
-            📈 Feature Comparison:
-
-            Basic Recommendations: {basic_rec_count}
-            Professional Recommendations: {prof_rec_count}
-            Has Risk Assessment: {has_risk_assessment}
-            Has Professional Plan: {has_prof_plan}
-            Quality Score: {quality_score}/100
-
-            Enhancement Level: {'PROFESSIONAL' if prof_rec_count > 0 else 'BASIC'}
-            """
-
-            logger.info(comparison_report)
+            logger.info(
+                COMPARISON_REPORT_TEMPLATE,
+                basic_rec_count,
+                prof_rec_count,
+                has_risk_assessment,
+                has_prof_plan,
+                quality_score,
+                'PROFESSIONAL' if prof_rec_count > 0 else 'BASIC'
+            )
 
             # Add validation
             validation = ValidationResult(
@@ -719,85 +975,88 @@ class ProfessionalIntegrationTester:
         logger.info("📋 INTEGRATION TEST REPORT")
         logger.info("="*80)
 
-        # Group results by severity
-        critical = [r for r in self.validation_results if r.severity == "critical"]
-        high = [r for r in self.validation_results if r.severity == "high"]
-        medium = [r for r in self.validation_results if r.severity == "medium"]
-        low = [r for r in self.validation_results if r.severity == "low"]
+        # Single pass: per-severity counts, serialized failures and professional-feature coverage
+        severity_counts = {
+            severity: {"total": 0, "passed": 0, "failed": 0} for severity in SEVERITY_LEVELS
+        }
+        failures = []
+        logged_failures = []
+        critical_failures = []
+        prof_total = prof_passed = 0
+        for r in self.validation_results:
+            passed = r.passed
+            severity = r.severity
+            counts = severity_counts.get(severity)
+            if counts is not None:
+                counts["total"] += 1
+                counts["passed" if passed else "failed"] += 1
+            if not passed:
+                failures.append({
+                    "check": r.check_name,
+                    "severity": severity,
+                    "details": r.details,
+                    "expected": str(r.expected_value),
+                    "actual": str(r.actual_value)
+                })
+                if len(logged_failures) < MAX_LOGGED_FAILURES:
+                    logged_failures.append(r)
+                if severity == "critical":
+                    critical_failures.append(r)
+            if "professional" in r.check_name.lower():
+                prof_total += 1
+                if passed:
+                    prof_passed += 1
 
         # Calculate statistics
         total_checks = len(self.validation_results)
-        passed_checks = len([r for r in self.validation_results if r.passed])
+        passed_checks = total_checks - len(failures)
         pass_rate = (passed_checks / total_checks * 100) if total_checks > 0 else 0
 
         # Summary
-        logger.info(f"""
-📊 Test Summary:
-  Total Checks: {total_checks}
-  Passed: {passed_checks}
-  Failed: {total_checks - passed_checks}
-  Pass Rate: {pass_rate:.1f}%
-
-📈 By Severity:
-  Critical: {len(critical)} ({len([r for r in critical if r.passed])} passed)
-  High: {len(high)} ({len([r for r in high if r.passed])} passed)
-  Medium: {len(medium)} ({len([r for r in medium if r.passed])} passed)
-  Low: {len(low)} ({len([r for r in low if r.passed])} passed)
-""")
+        logger.info(
+            SUMMARY_REPORT_TEMPLATE,
+            total_checks, passed_checks, total_checks - passed_checks, pass_rate,
+            *(severity_counts[severity][key] for severity in SEVERITY_LEVELS for key in ("total", "passed")),
+        )
 
         # Detailed failures
-        failures = [r for r in self.validation_results if not r.passed]
-        if failures:
-            logger.info("\n❌ Failed Checks:")
-            for failure in failures[:10]:  # Show first 10 failures
-                logger.info(f"""
-  [{failure.severity.upper()}] {failure.check_name}
-  Details: {failure.details}
-  Expected: {failure.expected_value}
-  Actual: {failure.actual_value}
-""")
+        if logged_failures and logger.isEnabledFor(logging.INFO):
+            # Show the first few failures in a single log record
+            logger.info("\n❌ Failed Checks:" + "".join(
+                FAILURE_REPORT_TEMPLATE.format(
+                    severity=f.severity.upper(),
+                    name=f.check_name,
+                    details=f.details,
+                    expected=f.expected_value,
+                    actual=f.actual_value,
+                )
+                for f in logged_failures
+            ))
 
         # Critical issues
-        critical_failures = [r for r in critical if not r.passed]
         if critical_failures:
             logger.error("\n🚨 CRITICAL ISSUES FOUND:")
             for issue in critical_failures:
                 logger.error(f"  - {issue.check_name}: {issue.details}")
 
         # Professional features assessment
-        prof_features = [r for r in self.validation_results if "professional" in r.check_name.lower()]
-        prof_passed = len([r for r in prof_features if r.passed])
-
-        logger.info(f"""
-🎯 Professional Features Assessment:
-  Total Professional Checks: {len(prof_features)}
-  Passed: {prof_passed}
-  Professional Feature Coverage: {(prof_passed/len(prof_features)*100) if prof_features else 0:.1f}%
-""")
+        prof_coverage = (prof_passed/prof_total*100) if prof_total else 0
+        logger.info(PROFESSIONAL_REPORT_TEMPLATE, prof_total, prof_passed, prof_coverage)
 
         # Overall verdict
-        if pass_rate >= 90 and len(critical_failures) == 0:
-            verdict = "✅ EXCELLENT - System is production ready"
-            verdict_color = "green"
-        elif pass_rate >= 70 and len(critical_failures) <= 2:
-            verdict = "⚠️ GOOD - Minor issues to address"
-            verdict_color = "yellow"
-        elif pass_rate >= 50:
-            verdict = "⚠️ NEEDS WORK - Several issues require attention"
-            verdict_color = "orange"
-        else:
-            verdict = "❌ FAILING - Major issues need resolution"
-            verdict_color = "red"
+        critical_count = len(critical_failures)
+        verdict, verdict_color = next(
+            ((label, color) for min_rate, max_critical, label, color in VERDICT_THRESHOLDS
+             if pass_rate >= min_rate and critical_count <= max_critical),
+            FAILING_VERDICT,
+        )
 
-        logger.info(f"""
-{"="*80}
-FINAL VERDICT: {verdict}
-{"="*80}
-""")
+        logger.info(VERDICT_REPORT_TEMPLATE, verdict)
 
-        # Save detailed report
+        # Save detailed report; timestamp and file name share one clock read
+        generated_at = datetime.now()
         report_data = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": generated_at.isoformat(),
             "summary": {
                 "total_checks": total_checks,
                 "passed": passed_checks,
@@ -805,53 +1064,106 @@ FINAL VERDICT: {verdict}
                 "pass_rate": pass_rate,
                 "verdict": verdict
             },
-            "by_severity": {
-                "critical": {
-                    "total": len(critical),
-                    "passed": len([r for r in critical if r.passed]),
-                    "failed": len([r for r in critical if not r.passed])
-                },
-                "high": {
-                    "total": len(high),
-                    "passed": len([r for r in high if r.passed]),
-                    "failed": len([r for r in high if not r.passed])
-                },
-                "medium": {
-                    "total": len(medium),
-                    "passed": len([r for r in medium if r.passed]),
-                    "failed": len([r for r in medium if not r.passed])
-                },
-                "low": {
-                    "total": len(low),
-                    "passed": len([r for r in low if r.passed]),
-                    "failed": len([r for r in low if not r.passed])
-                }
-            },
+            "by_severity": severity_counts,
             "professional_features": {
-                "total": len(prof_features),
+                "total": prof_total,
                 "passed": prof_passed,
-                "coverage": (prof_passed/len(prof_features)*100) if prof_features else 0
+                "coverage": prof_coverage
             },
-            "failures": [
-                {
-                    "check": f.check_name,
-                    "severity": f.severity,
-                    "details": f.details,
-                    "expected": str(f.expected_value),
-                    "actual": str(f.actual_value)
-                }
-                for f in failures
-            ]
+            "failures": failures
         }
 
         # Save to file
-        report_file = f"integration_test_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        with open(report_file, 'w') as f:
-            json.dump(report_data, f, indent=2, default=str)
+        report_file = f"integration_test_report_{generated_at.strftime('%Y%m%d_%H%M%S')}.json"
+        with open(report_file, 'wb') as f:
+            f.write(orjson.dumps(report_data, option=orjson.OPT_INDENT_2, default=str))
 
         logger.info(f"\n📄 Detailed report saved to: {report_file}")
 
-        return pass_rate >= 70 and len(critical_failures) == 0
+        return pass_rate >= 70 and critical_count == 0
+
+
+# =============================================================================
+# Pytest entry points: login and debt seeding run once per session
+# =============================================================================
+
+@pytest.fixture(scope="session")
+async def tester(live_api_client):
+    """Logged-in tester with the debt portfolio seeded, shared by every test below."""
+    integration_tester = ProfessionalIntegrationTester(client=live_api_client)
+    try:
+        await integration_tester.setup_test_environment()
+        await integration_tester.create_test_debts()
+    except httpx.ConnectError as e:
+        await integration_tester.aclose()
+        pytest.skip(f"API server not reachable at {API_BASE_URL}: {e}")
+
+    yield integration_tester
+
+    await integration_tester.aclose()
+
+
+@pytest.fixture(scope="session")
+async def insights_payload(tester):
+    """Shared insights payloads, keyed by INSIGHTS_QUERIES name."""
+    return await tester.fetch_insights()
+
+
+def _critical_failures_since(tester: ProfessionalIntegrationTester, start: int) -> List[str]:
+    """Names of critical checks that failed after index start."""
+    return [
+        r.check_name for r in tester.validation_results[start:]
+        if r.severity == "critical" and not r.passed
+    ]
+
+
+@pytest.mark.integration
+async def test_enhanced_insights_endpoint(tester):
+    start = len(tester.validation_results)
+    await tester.test_enhanced_insights_endpoint()
+    assert not _critical_failures_since(tester, start)
+
+
+@pytest.mark.integration
+async def test_data_transformation(tester, insights_payload):
+    start = len(tester.validation_results)
+    await tester.test_data_transformation(insights_payload)
+    assert not _critical_failures_since(tester, start)
+
+
+@pytest.mark.integration
+async def test_fallback_mechanisms(tester):
+    start = len(tester.validation_results)
+    await tester.test_fallback_mechanisms()
+    assert not _critical_failures_since(tester, start)
+
+
+@pytest.mark.integration
+async def test_enhanced_insights_endpoint_new(tester):
+    start = len(tester.validation_results)
+    await tester.test_enhanced_insights_endpoint_new()
+    assert not _critical_failures_since(tester, start)
+
+
+@pytest.mark.integration
+async def test_frontend_compatibility(tester, insights_payload):
+    start = len(tester.validation_results)
+    await tester.test_frontend_compatibility(insights_payload)
+    assert not _critical_failures_since(tester, start)
+
+
+@pytest.mark.integration
+async def test_consultation_quality(tester, insights_payload):
+    start = len(tester.validation_results)
+    await tester.test_consultation_quality(insights_payload)
+    assert not _critical_failures_since(tester, start)
+
+
+@pytest.mark.integration
+async def test_compare_basic_vs_enhanced(tester, insights_payload):
+    start = len(tester.validation_results)
+    await tester.compare_basic_vs_enhanced(insights_payload)
+    assert not _critical_failures_since(tester, start)
 
 
 async def main():
@@ -863,14 +1175,33 @@ async def main():
         await tester.setup_test_environment()
         await tester.create_test_debts()
 
-        # Core integration tests
-        await tester.test_enhanced_insights_endpoint()
-        await tester.test_data_transformation()
+        # Fetch the shared insights payloads once, before the fallback test edits the profile
+        insights = await tester.fetch_insights()
+
+        # Core integration tests; the read-only phases run concurrently
+        phases = {
+            "Enhanced insights endpoint": tester.test_enhanced_insights_endpoint(),
+            "Data transformation": tester.test_data_transformation(insights),
+            "Enhanced endpoint": tester.test_enhanced_insights_endpoint_new(),
+            "Frontend compatibility": tester.test_frontend_compatibility(insights),
+            "Consultation quality": tester.test_consultation_quality(insights),
+            "Basic vs enhanced comparison": tester.compare_basic_vs_enhanced(insights)
+        }
+        outcomes = await asyncio.gather(*phases.values(), return_exceptions=True)
+
+        # A phase that raised is reported as a failed check instead of aborting the others
+        for phase_name, outcome in zip(phases, outcomes):
+            if isinstance(outcome, Exception):
+                logger.error(f"  ✗ {phase_name} raised: {outcome!r}")
+                tester.validation_results.append(ValidationResult(
+                    check_name=f"{phase_name} phase completed",
+                    passed=False,
+                    details=f"Phase raised {type(outcome).__name__}: {outcome}",
+                    severity="critical"
+                ))
+
+        # Edits the user's income, so it runs alone once the reads are done
         await tester.test_fallback_mechanisms()
-        await tester.test_enhanced_insights_endpoint_new()
-        await tester.test_frontend_compatibility()
-        await tester.test_consultation_quality()
-        await tester.compare_basic_vs_enhanced()
 
         # Generate report
         success = await tester.generate_integration_report()
@@ -884,6 +1215,9 @@ async def main():
         traceback.print_exc()
         sys.exit(1)
 
+    finally:
+        await tester.aclose()
+
 
 if __name__ == "__main__":
     asyncio.run(main())
\ No newline at end of file
@@ -3,6 +3,7 @@
 Comprehensive validation of professional debt consultant improvements
 """
 
+import functools
 import sys
 import os
 from datetime import datetime, date
@@ -16,6 +17,25 @@ from app.agents.debt_optimizer_agent.enhanced_debt_optimizer import EnhancedDebt
 from app.agents.debt_optimizer_agent.enhanced_orchestrator import EnhancedAIOrchestrator
 
 
+@functools.lru_cache(maxsize=None)
+def _recommendation_agent() -> AIRecommendationAgent:
+    """Recommendation agent shared by every check in this module."""
+    return AIRecommendationAgent()
+
+
+@functools.lru_cache(maxsize=None)
+def _debt_optimizer() -> EnhancedDebtOptimizer:
+    """Debt optimizer shared by every check in this module."""
+    return EnhancedDebtOptimizer()
+
+
+@functools.lru_cache(maxsize=None)
+def _system_prompts() -> tuple:
+    """(main, simple, optimizer) prompts, built once per process."""
+    agent = _recommendation_agent()
+    return agent._get_system_prompt(), agent._get_simple_prompt(), _debt_optimizer()._get_system_prompt()
+
+
 def test_professional_prompt_quality():
     """Test the quality and professional nature of enhanced prompts."""
     print("🎯 PROFESSIONAL CONSULTATION VALIDATION")
@@ -24,9 +44,7 @@ def test_professional_prompt_quality():
     # Test AI Recommendation Agent Prompts
     print("\n💡 AI Recommendation Agent - Professional Enhancement Analysis:")
 
-    agent = AIRecommendationAgent()
-    main_prompt = agent._get_system_prompt()
-    simple_prompt = agent._get_simple_prompt()
+    main_prompt, simple_prompt, optimizer_prompt = _system_prompts()
 
     print(f"✅ Main prompt length: {len(main_prompt):,} characters")
     print(f"✅ Simple prompt length: {len(simple_prompt):,} characters")
@@ -58,9 +76,11 @@ def test_professional_prompt_quality():
     print("\n🔍 Professional Framework Analysis:")
     total_score = 0
     max_score = 0
+    main_prompt_l = main_prompt.lower()
 
     for category, elements in professional_elements.items():
-        found = sum(1 for element in elements if element.lower() in main_prompt.lower())
+        matches = [element.lower() in main_prompt_l for element in elements]
+        found = sum(matches)
         max_score += len(elements)
         total_score += found
         percentage = (found / len(elements)) * 100
@@ -68,11 +88,8 @@ def test_professional_prompt_quality():
         print(f"\n   {category}:")
         print(f"   📊 Coverage: {found}/{len(elements)} elements ({percentage:.1f}%)")
 
-        for element in elements:
-            if element.lower() in main_prompt.lower():
-                print(f"      ✅ {element}")
-            else:
-                print(f"      ❌ {element}")
+        for element, matched in zip(elements, matches):
+            print(f"      {'✅' if matched else '❌'} {element}")
 
     overall_score = (total_score / max_score) * 100
     print(f"\n🎯 Overall Professional Framework Score: {overall_score:.1f}%")
@@ -80,9 +97,6 @@ def test_professional_prompt_quality():
     # Test Enhanced Debt Optimizer Prompts
     print("\n⚡ Enhanced Debt Optimizer - Professional Enhancement Analysis:")
 
-    optimizer = EnhancedDebtOptimizer()
-    optimizer_prompt = optimizer._get_system_prompt()
-
     print(f"✅ Optimizer prompt length: {len(optimizer_prompt):,} characters")
 
     # Methodology integration check
@@ -97,9 +111,10 @@ def test_professional_prompt_quality():
     ]
 
     methodology_score = 0
+    optimizer_prompt_l = optimizer_prompt.lower()
     print("\n🔍 Methodology Integration Analysis:")
     for methodology in methodologies:
-        if methodology.lower() in optimizer_prompt.lower():
+        if methodology.lower() in optimizer_prompt_l:
             print(f"   ✅ {methodology}")
             methodology_score += 1
         else:
@@ -131,9 +146,10 @@ def test_professional_prompt_quality():
         ]
 
         orch_score = 0
+        combined_doc_l = (class_doc + (method_doc or "")).lower()
         print("\n🔍 Orchestrator Professional Elements:")
         for element in orchestrator_elements:
-            if element.lower() in (class_doc + (method_doc or "")).lower():
+            if element.lower() in combined_doc_l:
                 print(f"   ✅ {element}")
                 orch_score += 1
             else:
@@ -160,8 +176,7 @@ def test_professional_output_structure():
     ]
 
     print("✅ Professional recommendation types available:")
-    for category in professional_categories:
-        print(f"   • {category}")
+    print("\n".join(f"   • {category}" for category in professional_categories))
 
     # Test timeline phases
     print("\n⏱️  Professional Timeline Phases:")
@@ -173,8 +188,7 @@ def test_professional_output_structure():
     ]
 
     print("✅ Professional timeline structure:")
-    for phase in timeline_phases:
-        print(f"   • {phase}")
+    print("\n".join(f"   • {phase}" for phase in timeline_phases))
 
     # Test difficulty assessments
     print("\n📊 Professional Difficulty Assessments:")
@@ -185,8 +199,7 @@ def test_professional_output_structure():
     ]
 
     print("✅ Professional difficulty classifications:")
-    for level in difficulty_levels:
-        print(f"   • {level}")
+    print("\n".join(f"   • {level}" for level in difficulty_levels))
 
     return True
 
@@ -200,10 +213,10 @@ def test_integration_quality():
         # Test component initialization
         print("🔧 Testing component initialization...")
 
-        recommendation_agent = AIRecommendationAgent()
+        recommendation_agent = _recommendation_agent()
         print("✅ AI Recommendation Agent initialized")
 
-        debt_optimizer = EnhancedDebtOptimizer()
+        _debt_optimizer()
         print("✅ Enhanced Debt Optimizer initialized")
 
         orchestrator = EnhancedAIOrchestrator()
@@ -212,9 +225,7 @@ def test_integration_quality():
         # Test prompt accessibility
         print("\n📋 Testing prompt accessibility...")
 
-        rec_prompt = recommendation_agent._get_system_prompt()
-        rec_simple = recommendation_agent._get_simple_prompt()
-        opt_prompt = debt_optimizer._get_system_prompt()
+        rec_prompt, rec_simple, opt_prompt = _system_prompts()
 
         print(f"✅ Recommendation prompts accessible ({len(rec_prompt)} + {len(rec_simple)} chars)")
         print(f"✅ Optimizer prompt accessible ({len(opt_prompt)} chars)")
@@ -223,9 +234,13 @@ def test_integration_quality():
         print("\n🛡️  Testing fallback mechanisms...")
 
         # Check if fallback stats tracking exists
-        if hasattr(recommendation_agent, 'fallback_stats'):
+        try:
+            fallback_stats = recommendation_agent.fallback_stats
+        except AttributeError:
+            pass
+        else:
             print("✅ Fallback statistics tracking available")
-            print(f"   📊 Tracking: {list(recommendation_agent.fallback_stats.keys())}")
+            print(f"   📊 Tracking: {list(fallback_stats.keys())}")
 
         # Check if calculation fallback exists
         if hasattr(recommendation_agent, 'generate_recommendations_calculation_fallback'):
@@ -15,27 +15,25 @@ async def test_with_real_user():
         debt_repo = DebtRepository()
         analytics_repo = AnalyticsRepository()
 
-        # Get the user with debts
-        users = await user_repo.get_all()
-        user_with_debts = None
-
-        for user in users:
-            user_debts = await debt_repo.get_debts_by_user_id(user.id)
-            if user_debts and len(user_debts) > 0:
-                user_with_debts = user
-                print(f'Found user with debts: {user.email}')
-                print(f'User ID: {user.id}')
-                print(f'Number of debts: {len(user_debts)}')
-
-                # Show debt details
-                for i, debt in enumerate(user_debts):
-                    print(f'  Debt {i+1}: {debt.name} - ₹{debt.current_balance} at {debt.interest_rate}%')
-                break
+        # Get the user with debts in one query instead of probing every user
+        user_with_debts = await user_repo.get_first_user_with_debts()
 
         if not user_with_debts:
             print('No user with debts found')
             return
 
+        user_debts = await debt_repo.get_debts_by_user_id(user_with_debts.id)
+        print(f'Found user with debts: {user_with_debts.email}')
+        print(f'User ID: {user_with_debts.id}')
+        print(f'Number of debts: {len(user_debts)}')
+
+        # Show debt details in a single write
+        if user_debts:
+            print('\n'.join(
+                f'  Debt {i}: {debt.name} - ₹{debt.current_balance} at {debt.interest_rate}%'
+                for i, debt in enumerate(user_debts, 1)
+            ))
+
         # Test AI insights with this user
         ai_service = AIService(debt_repo, user_repo, analytics_repo)
 
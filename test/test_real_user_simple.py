@@ -5,6 +5,37 @@ Simple test to create debts and test AI insights for Aditya
 
 import requests
 import json
+from requests.adapters import HTTPAdapter
+
+# Decode response bodies with orjson when it is installed (dev extras); json.loads takes bytes too
+try:
+    from orjson import loads as _loads
+except ImportError:
+    _loads = json.loads
+
+# Request bodies are serialized once, compactly, and sent as raw data
+JSON_HEADERS = {"Content-Type": "application/json"}
+_COMPACT = (",", ":")
+
+LOGIN_BODY = json.dumps({
+    "email": "aditya@test.com",
+    "password": "Password123"
+}, separators=_COMPACT)
+
+DEBT_BODY = json.dumps({
+    "name": "HDFC Credit Card",
+    "debt_type": "credit_card",
+    "principal_amount": 80000.00,
+    "current_balance": 65000.00,
+    "interest_rate": 42.0,
+    "minimum_payment": 3250.00,
+    "due_date": "2024-02-15",
+    "lender": "HDFC Bank",
+    "payment_frequency": "monthly",
+    "is_high_priority": True
+}, separators=_COMPACT)
+
+INSIGHTS_BODY = json.dumps({"includeDti": True}, separators=_COMPACT)
 
 def test_with_fresh_session():
     """Test with a fresh session."""
@@ -13,42 +44,27 @@ def test_with_fresh_session():
     print("🎯 Testing AI Insights with Real User Data")
     print("=" * 50)
 
-    # Create session and login
+    # Create session and login; one small keep-alive pool serves every call below
     session = requests.Session()
+    session.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
 
     print("🔑 Logging in as Aditya...")
-    login_response = session.post(f"{base_url}/auth/login", json={
-        "email": "aditya@test.com",
-        "password": "Password123"
-    })
+    login_response = session.post(f"{base_url}/auth/login", data=LOGIN_BODY, headers=JSON_HEADERS)
 
     if login_response.status_code != 200:
         print(f"❌ Login failed: {login_response.text}")
         return False
 
-    user_data = login_response.json()
+    user_data = _loads(login_response.content)
     user_id = user_data["user"]["id"]
     print(f"✅ Logged in: {user_id}")
 
     # Create one debt first to test
     print("\n💳 Creating test debt...")
-    debt_data = {
-        "name": "HDFC Credit Card",
-        "debt_type": "credit_card",
-        "principal_amount": 80000.00,
-        "current_balance": 65000.00,
-        "interest_rate": 42.0,
-        "minimum_payment": 3250.00,
-        "due_date": "2024-02-15",
-        "lender": "HDFC Bank",
-        "payment_frequency": "monthly",
-        "is_high_priority": True
-    }
-
-    debt_response = session.post(f"{base_url}/debts", json=debt_data)
+    debt_response = session.post(f"{base_url}/debts", data=DEBT_BODY, headers=JSON_HEADERS)
     if debt_response.status_code == 201:
         print("✅ Debt created successfully")
-        debt_created = debt_response.json()
+        debt_created = _loads(debt_response.content)
         print(f"   Debt ID: {debt_created.get('id', 'Unknown')}")
         print(f"   Balance: ₹{debt_created.get('current_balance', 0):,.0f}")
     elif "already exists" in debt_response.text.lower():
@@ -58,12 +74,12 @@ def test_with_fresh_session():
 
     # Test AI insights
     print("\n🤖 Testing AI insights...")
-    insights_response = session.post(f"{base_url}/ai/insights", json={"includeDti": True})
+    insights_response = session.post(f"{base_url}/ai/insights", data=INSIGHTS_BODY, headers=JSON_HEADERS)
 
     print(f"AI Response Status: {insights_response.status_code}")
 
     if insights_response.status_code == 200:
-        insights = insights_response.json()
+        insights = _loads(insights_response.content)
         print("✅ AI Insights generated!")
 
         # Show basic info
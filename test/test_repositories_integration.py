@@ -3,8 +3,9 @@ Integration tests for repository layer.
 Tests database operations and repository functionality.
 """
 
+import itertools
 import pytest
-from uuid import uuid4
+from uuid import UUID, uuid4
 
 from app.repositories.user_repository import UserRepository
 from app.repositories.debt_repository import DebtRepository
@@ -15,15 +16,73 @@ from app.models.debt import DebtCreate, DebtType, PaymentFrequency, DebtUpdate
 from app.models.payment import PaymentCreate, PaymentStatus
 
 
+# Test emails come from a counter under a random per-process prefix: one os.urandom read
+# per process instead of one per uuid4(). The prefix keeps values distinct across runs and
+# xdist workers, so concurrent workers never wait on each other's uncommitted emails in
+# the users.email unique index.
+_UUID_PREFIX = uuid4().int >> 64 << 64
+_uuid_counter = itertools.count(1)
+
+
+@pytest.fixture(autouse=True)
+def sequential_uuid4(monkeypatch):
+    """Make this module's uuid4() calls return sequential UUIDs under _UUID_PREFIX."""
+    monkeypatch.setitem(globals(), "uuid4", lambda: UUID(int=_UUID_PREFIX | next(_uuid_counter)))
+
+
+# Each test class is its own xdist_group, so `pytest -n auto --dist loadgroup` spreads the
+# classes over workers. Workers need no separate schema: every write stays inside a
+# transaction that is rolled back, and unique values (emails via _UUID_PREFIX, row ids via
+# uuid4) differ per worker, so workers neither see nor block on each other's rows.
+
+# The user and debts below are shared by every test in this module. They live in the
+# module_tx_pool transaction and each test runs in a SAVEPOINT inside it, so per-test
+# writes (payments, balance changes) are undone without re-creating the shared rows.
+
+@pytest.fixture(scope="function")
+async def tx_pool(module_tx_pool):
+    """Per-test SAVEPOINT on the module transaction."""
+    async with module_tx_pool.savepoint() as pool:
+        yield pool
+
+
+@pytest.fixture(scope="module")
+async def test_user(module_tx_pool):
+    """User shared by the module; inserted once. Do not mutate it."""
+    return await UserRepository(pool=module_tx_pool).create_user(UserCreate(
+        email=f"test_{uuid4()}@example.com",
+        full_name="Test User",
+        hashed_password="hashed_password",
+        monthly_income=50000.0
+    ))
+
+
+@pytest.fixture(scope="module")
+async def test_debts(test_user, module_tx_pool, helpers):
+    """Debts shared by the module, owned by test_user."""
+    return await DebtRepository(pool=module_tx_pool).bulk_create_debts([
+        helpers.create_test_debt_data(test_user.id, name="Test Credit Card", interest_rate=18.99),
+        helpers.create_test_debt_data(
+            test_user.id,
+            name="Test Personal Loan",
+            debt_type=DebtType.PERSONAL_LOAN,
+            principal_amount=10000.0,
+            current_balance=8000.0,
+            interest_rate=12.5,
+            minimum_payment=250.0
+        )
+    ])
+
+
 @pytest.mark.integration
 @pytest.mark.database
+@pytest.mark.xdist_group(name="user_repository")
 class TestUserRepository:
     """Test UserRepository database operations."""
 
-    async def test_create_and_get_user(self, test_session):
+    async def test_create_and_get_user(self, tx_pool):
         """Test creating and retrieving a user."""
-        repo = UserRepository()
-        repo.session = test_session  # Override session for testing
+        repo = UserRepository(pool=tx_pool)
 
         # Create user
         user_data = UserCreate(
@@ -43,10 +102,9 @@ class TestUserRepository:
         assert retrieved_user.id == created_user.id
         assert retrieved_user.email == created_user.email
 
-    async def test_get_user_by_email(self, test_session):
+    async def test_get_user_by_email(self, tx_pool):
         """Test retrieving user by email."""
-        repo = UserRepository()
-        repo.session = test_session
+        repo = UserRepository(pool=tx_pool)
 
         user_data = UserCreate(
             email=f"test_{uuid4()}@example.com",
@@ -62,10 +120,9 @@ class TestUserRepository:
         assert retrieved_user.id == created_user.id
         assert retrieved_user.email == user_data.email
 
-    async def test_update_user(self, test_session):
+    async def test_update_user(self, tx_pool):
         """Test updating user information."""
-        repo = UserRepository()
-        repo.session = test_session
+        repo = UserRepository(pool=tx_pool)
 
         # Create user
         user_data = UserCreate(
@@ -84,10 +141,9 @@ class TestUserRepository:
         assert updated_user.monthly_income == 60000.0
         assert updated_user.email == user_data.email  # Unchanged
 
-    async def test_delete_user(self, test_session):
+    async def test_delete_user(self, tx_pool):
         """Test soft deleting a user."""
-        repo = UserRepository()
-        repo.session = test_session
+        repo = UserRepository(pool=tx_pool)
 
         # Create user
         user_data = UserCreate(
@@ -106,16 +162,45 @@ class TestUserRepository:
         deleted_user = await repo.get_user_by_id(user.id)
         assert deleted_user.is_active is False
 
+    async def test_get_first_user_with_debts(self, tx_pool, test_debts, helpers):
+        """Test finding the newest user that has active debts."""
+        repo = UserRepository(pool=tx_pool)
+        debt_owner_id = test_debts[0].user_id
+
+        # Newer than the debt owner, but has no debts of its own
+        await repo.create_user(UserCreate(
+            email=f"test_{uuid4()}@example.com",
+            full_name="Debt Free User",
+            hashed_password="hashed_password",
+            monthly_income=50000.0
+        ))
+
+        user = await repo.get_first_user_with_debts()
+        assert user is not None
+        assert user.id == debt_owner_id
+
+        # A newer user with a debt takes over as the newest user with debts
+        newer_owner = await repo.create_user(UserCreate(
+            email=f"test_{uuid4()}@example.com",
+            full_name="Newer Debt Owner",
+            hashed_password="hashed_password",
+            monthly_income=50000.0
+        ))
+        await DebtRepository(pool=tx_pool).create_debt(helpers.create_test_debt_data(newer_owner.id))
+
+        user = await repo.get_first_user_with_debts()
+        assert user.id == newer_owner.id
+
 
 @pytest.mark.integration
 @pytest.mark.database
+@pytest.mark.xdist_group(name="debt_repository")
 class TestDebtRepository:
     """Test DebtRepository database operations."""
 
-    async def test_create_and_get_debt(self, test_session, test_user):
+    async def test_create_and_get_debt(self, tx_pool, test_user):
         """Test creating and retrieving a debt."""
-        repo = DebtRepository()
-        repo.session = test_session
+        repo = DebtRepository(pool=tx_pool)
 
         debt_data = DebtCreate(
             user_id=test_user.id,
@@ -140,10 +225,9 @@ class TestDebtRepository:
         assert retrieved_debt.id == created_debt.id
         assert retrieved_debt.name == debt_data.name
 
-    async def test_get_debts_by_user_id(self, test_session, test_user):
+    async def test_get_debts_by_user_id(self, tx_pool, test_user, test_debts):
         """Test retrieving all debts for a user."""
-        repo = DebtRepository()
-        repo.session = test_session
+        repo = DebtRepository(pool=tx_pool)
 
         # Create multiple debts
         debts_data = [
@@ -162,23 +246,19 @@ class TestDebtRepository:
             for i in range(3)
         ]
 
-        created_debts = []
-        for debt_data in debts_data:
-            debt = await repo.create_debt(debt_data)
-            created_debts.append(debt)
+        await repo.bulk_create_debts(debts_data)
 
         # Retrieve all debts for user
         user_debts = await repo.get_debts_by_user_id(test_user.id)
-        assert len(user_debts) == 3
+        assert len(user_debts) == len(test_debts) + 3
 
         # Verify debts belong to user
         for debt in user_debts:
             assert debt.user_id == test_user.id
 
-    async def test_update_debt(self, test_session, test_user):
+    async def test_update_debt(self, tx_pool, test_user):
         """Test updating debt information."""
-        repo = DebtRepository()
-        repo.session = test_session
+        repo = DebtRepository(pool=tx_pool)
 
         # Create debt
         debt_data = DebtCreate(
@@ -208,10 +288,9 @@ class TestDebtRepository:
         assert updated_debt.name == "Updated Debt"
         assert updated_debt.principal_amount == debt_data.principal_amount  # Unchanged
 
-    async def test_delete_debt(self, test_session, test_user):
+    async def test_delete_debt(self, tx_pool, test_user):
         """Test soft deleting a debt."""
-        repo = DebtRepository()
-        repo.session = test_session
+        repo = DebtRepository(pool=tx_pool)
 
         # Create debt
         debt_data = DebtCreate(
@@ -239,13 +318,13 @@ class TestDebtRepository:
 
 @pytest.mark.integration
 @pytest.mark.database
+@pytest.mark.xdist_group(name="payment_repository")
 class TestPaymentRepository:
     """Test PaymentRepository database operations."""
 
-    async def test_create_and_get_payment(self, test_session, test_user, test_debts):
+    async def test_create_and_get_payment(self, tx_pool, test_user, test_debts):
         """Test creating and retrieving a payment."""
-        repo = PaymentRepository()
-        repo.session = test_session
+        repo = PaymentRepository(pool=tx_pool)
 
         debt = test_debts[0]
         payment_data = PaymentCreate(
@@ -268,10 +347,9 @@ class TestPaymentRepository:
         assert retrieved_payment.id == created_payment.id
         assert retrieved_payment.amount == payment_data.amount
 
-    async def test_get_payments_by_debt_id(self, test_session, test_user, test_debts):
+    async def test_get_payments_by_debt_id(self, tx_pool, test_user, test_debts):
         """Test retrieving payments for a specific debt."""
-        repo = PaymentRepository()
-        repo.session = test_session
+        repo = PaymentRepository(pool=tx_pool)
 
         debt = test_debts[0]
 
@@ -289,10 +367,7 @@ class TestPaymentRepository:
             for i in range(3)
         ]
 
-        created_payments = []
-        for payment_data in payments_data:
-            payment = await repo.create_payment(payment_data)
-            created_payments.append(payment)
+        await repo.bulk_create_payments(payments_data)
 
         # Retrieve payments for debt
         debt_payments = await repo.get_payments_by_debt_id(debt.id)
@@ -302,10 +377,9 @@ class TestPaymentRepository:
         for payment in debt_payments:
             assert payment.debt_id == debt.id
 
-    async def test_update_payment(self, test_session, test_user, test_debts):
+    async def test_update_payment(self, tx_pool, test_user, test_debts):
         """Test updating payment information."""
-        repo = PaymentRepository()
-        repo.session = test_session
+        repo = PaymentRepository(pool=tx_pool)
 
         debt = test_debts[0]
         payment_data = PaymentCreate(
@@ -328,10 +402,9 @@ class TestPaymentRepository:
         assert updated_payment.notes == "Updated payment"
         assert updated_payment.payment_date == payment_data.payment_date  # Unchanged
 
-    async def test_delete_payment(self, test_session, test_user, test_debts):
+    async def test_delete_payment(self, tx_pool, test_user, test_debts):
         """Test deleting a payment."""
-        repo = PaymentRepository()
-        repo.session = test_session
+        repo = PaymentRepository(pool=tx_pool)
 
         debt = test_debts[0]
         payment_data = PaymentCreate(
@@ -353,13 +426,13 @@ class TestPaymentRepository:
 
 @pytest.mark.integration
 @pytest.mark.database
+@pytest.mark.xdist_group(name="analytics_repository")
 class TestAnalyticsRepository:
     """Test AnalyticsRepository database operations."""
 
-    async def test_calculate_debt_summary(self, test_session, test_user, test_debts):
+    async def test_calculate_debt_summary(self, tx_pool, test_user, test_debts):
         """Test calculating debt summary statistics."""
-        repo = AnalyticsRepository()
-        repo.session = test_session
+        repo = AnalyticsRepository(pool=tx_pool)
 
         # Calculate summary
         summary = await repo.calculate_debt_summary(test_user.id)
@@ -374,23 +447,22 @@ class TestAnalyticsRepository:
         assert summary["total_debt"] == expected_total_debt
         assert summary["debt_count"] == len(test_debts)
 
-    async def test_calculate_payment_history(self, test_session, test_user, test_debts):
+    async def test_calculate_payment_history(self, tx_pool, test_user, test_debts):
         """Test calculating payment history analytics."""
-        repo = AnalyticsRepository()
-        repo.session = test_session
+        repo = AnalyticsRepository(pool=tx_pool)
 
         # Create some payments first
-        payment_repo = PaymentRepository()
-        payment_repo.session = test_session
+        payment_repo = PaymentRepository(pool=tx_pool)
 
-        for debt in test_debts:
-            payment_data = PaymentCreate(
+        await payment_repo.bulk_create_payments([
+            PaymentCreate(
                 debt_id=debt.id,
                 user_id=test_user.id,
                 amount=debt.minimum_payment,
                 payment_date="2025-01-15"
             )
-            await payment_repo.create_payment(payment_data)
+            for debt in test_debts
+        ])
 
         # Calculate payment analytics
         analytics = await repo.calculate_payment_analytics(test_user.id)
@@ -405,19 +477,16 @@ class TestAnalyticsRepository:
 
 @pytest.mark.integration
 @pytest.mark.database
+@pytest.mark.xdist_group(name="repository_workflow")
 class TestRepositoryIntegration:
     """Test repository integration and cross-repository operations."""
 
-    async def test_user_debt_payment_workflow(self, test_session):
+    async def test_user_debt_payment_workflow(self, tx_pool):
         """Test complete workflow: user -> debt -> payment."""
         # Setup repositories
-        user_repo = UserRepository()
-        debt_repo = DebtRepository()
-        payment_repo = PaymentRepository()
-
-        user_repo.session = test_session
-        debt_repo.session = test_session
-        payment_repo.session = test_session
+        user_repo = UserRepository(pool=tx_pool)
+        debt_repo = DebtRepository(pool=tx_pool)
+        payment_repo = PaymentRepository(pool=tx_pool)
 
         # Create user
         user_data = UserCreate(
@@ -459,11 +528,8 @@ class TestRepositoryIntegration:
         assert payment.debt_id == debt.id
         assert debt.user_id == user.id
 
-        # Verify data integrity
-        retrieved_user = await user_repo.get_user_by_id(user.id)
-        retrieved_debt = await debt_repo.get_by_id(debt.id)
-        retrieved_payment = await payment_repo.get_payment_by_id(payment.id)
-
-        assert retrieved_user.email == user_data.email
-        assert retrieved_debt.name == debt_data.name
-        assert retrieved_payment.amount == payment_data.amount
+        # Verify data integrity; create_* return the stored rows (INSERT ... RETURNING *),
+        # and the getters are covered by the test_create_and_get_* tests
+        assert user.email == user_data.email
+        assert debt.name == debt_data.name
+        assert payment.amount == payment_data.amount